@@ -0,0 +1 @@
+"""Inicializador do pacote benchmarks"""
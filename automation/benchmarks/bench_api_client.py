@@ -0,0 +1,203 @@
+"""
+Benchmark de throughput do APIClient contra o servidor REST simulado
+
+Uso (a partir do diretório automation):
+    python -m benchmarks.bench_api_client --pages 20 --latency-ms 80 --concurrency 1 4 8
+"""
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from benchmarks.mock_api_server import MockAPIConfig, MockAPIServer
+from src.collectors import APIClient
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Pico de memória residente do processo
+    
+    O valor é o máximo desde o início do processo; por isso cada caso roda
+    em um processo próprio (`run_isolated`).
+    
+    Returns:
+        Pico de RSS em MB ou None se indisponível
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reporta em KB, macOS em bytes
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except (ImportError, AttributeError):
+        return None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil por interpolação linear"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def run_case(base_url: str, pages: int, per_page: int, concurrency: int, mode: str,
+             cache_dir: Optional[str], logger: logging.Logger) -> Dict[str, Any]:
+    """
+    Executa fetch_data uma vez e coleta as métricas
+    
+    Args:
+        base_url: URL do servidor simulado
+        pages: Limite de páginas
+        per_page: Registros por página
+        concurrency: Requisições simultâneas
+        mode: Modo de paginação (page, cursor, link)
+        cache_dir: Diretório do cache HTTP (None desativa)
+        logger: Logger
+    
+    Returns:
+        Métricas do caso
+    """
+    config = {
+        'base_url': base_url,
+        'auth_type': 'none',
+        'endpoints': {'data': '/dados'},
+        'pagination': {
+            'enabled': True,
+            'mode': mode,
+            'per_page': per_page,
+            'max_pages': pages + 1,
+            'concurrency': concurrency
+        },
+        'cache': {'enabled': cache_dir is not None, 'dir': cache_dir or ''}
+    }
+    
+    client = APIClient(config, logger)
+    start = time.perf_counter()
+    records = client.fetch_data()
+    elapsed = time.perf_counter() - start
+    
+    latencies = [s['latency_ms'] for s in client.page_stats]
+    counters = client.scheduler.stats()
+    client.close()
+    
+    return {
+        'mode': mode,
+        'concurrency': concurrency,
+        'cache': cache_dir is not None,
+        'records': len(records),
+        'seconds': elapsed,
+        'records_per_s': len(records) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'throttled': counters['throttled'],
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def _init_worker(log_level: int):
+    """Configura o log no processo filho"""
+    logging.basicConfig(level=log_level)
+
+
+def run_isolated(log_level: int, *args) -> Dict[str, Any]:
+    """
+    Executa `run_case` em um processo novo
+    
+    O pico de RSS fica restrito ao caso, em vez de acumular o máximo dos
+    casos anteriores do mesmo processo.
+    
+    Args:
+        log_level: Nível de log no processo filho
+        *args: Argumentos de `run_case`
+    
+    Returns:
+        Métricas do caso
+    """
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context,
+                             initializer=_init_worker, initargs=(log_level,)) as executor:
+        return executor.submit(run_case, *args).result()
+
+
+def print_report(results: List[Dict[str, Any]]):
+    """Imprime a tabela de resultados"""
+    header = f"{'modo':<7}{'conc':>5}{'cache':>7}{'registros':>11}{'tempo(s)':>10}{'reg/s':>11}" \
+             f"{'p50(ms)':>9}{'p95(ms)':>9}{'429':>6}{'RSS(MB)':>9}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.1f}" if r['peak_rss_mb'] is not None else '-'
+        print(
+            f"{r['mode']:<7}{r['concurrency']:>5}{('sim' if r['cache'] else 'não'):>7}{r['records']:>11}"
+            f"{r['seconds']:>10.2f}{r['records_per_s']:>11.0f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}"
+            f"{r['throttled']:>6}{rss:>9}"
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark do APIClient (Fonte 2)")
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--payload-bytes', type=int, default=200)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--modes', nargs='+', default=['page'], choices=['page', 'cursor', 'link'])
+    parser.add_argument('--cache', action='store_true', help="Repetir cada caso com cache HTTP aquecido")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    
+    log_level = logging.DEBUG if args.verbose else logging.WARNING
+    logging.basicConfig(level=log_level)
+    logger = logging.getLogger('bench_api_client')
+    
+    mock_config = MockAPIConfig(
+        total_pages=args.pages,
+        page_size=args.per_page,
+        latency_ms=args.latency_ms,
+        payload_bytes=args.payload_bytes,
+        throttle_rate=args.throttle_rate,
+        seed=42
+    )
+    
+    results = []
+    with MockAPIServer(mock_config) as server:
+        for mode in args.modes:
+            for concurrency in args.concurrency:
+                results.append(run_isolated(log_level, server.base_url, args.pages, args.per_page,
+                                            concurrency, mode, None, logger))
+                
+                if args.cache:
+                    cache_dir = tempfile.mkdtemp(prefix='bench_http_cache_')
+                    try:
+                        # Primeira execução aquece o cache; a segunda é medida
+                        run_case(server.base_url, args.pages, args.per_page, concurrency, mode, cache_dir, logger)
+                        results.append(run_isolated(log_level, server.base_url, args.pages, args.per_page,
+                                                    concurrency, mode, cache_dir, logger))
+                    finally:
+                        shutil.rmtree(cache_dir, ignore_errors=True)
+    
+    print(f"\nServidor: {args.pages} páginas x {args.per_page} registros, "
+          f"latência {args.latency_ms:.0f} ms, payload {args.payload_bytes} B, 429 {args.throttle_rate:.0%}\n")
+    print_report(results)
+    print(f"\nRequisições no servidor: {mock_config.counters}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Servidor REST local que simula a API da Fonte 2 para testes de desempenho
+"""
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
+from typing import Dict, Any, Optional
+
+
+class MockAPIConfig:
+    """Parâmetros do servidor simulado"""
+    
+    def __init__(self, total_pages: int = 10, page_size: int = 100, latency_ms: float = 50,
+                 payload_bytes: int = 200, throttle_rate: float = 0.0, retry_after: int = 1,
+                 etag: bool = True, seed: Optional[int] = None):
+        """
+        Args:
+            total_pages: Número de páginas com dados
+            page_size: Registros por página (limita o per_page solicitado)
+            latency_ms: Latência artificial por requisição
+            payload_bytes: Tamanho aproximado do campo de texto de cada registro
+            throttle_rate: Fração de requisições respondidas com 429 (0 a 1)
+            retry_after: Valor do header Retry-After nas respostas 429
+            etag: Enviar ETag e responder 304 a If-None-Match
+            seed: Semente para a injeção de 429 (reprodutibilidade)
+        """
+        self.total_pages = total_pages
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.payload_bytes = payload_bytes
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.etag = etag
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {'requests': 0, 'ok': 0, 'not_modified': 0, 'throttled': 0}
+    
+    @property
+    def total_records(self) -> int:
+        """Total de registros disponíveis"""
+        return self.total_pages * self.page_size
+    
+    def count(self, key: str):
+        """Incrementa um contador de forma thread-safe"""
+        with self.lock:
+            self.counters[key] += 1
+    
+    def should_throttle(self) -> bool:
+        """Sorteia se a requisição atual recebe 429"""
+        with self.lock:
+            return self.random.random() < self.throttle_rate
+
+
+def build_record(index: int, payload_bytes: int) -> Dict[str, Any]:
+    """
+    Gera um registro determinístico no formato da Fonte 2
+    
+    Args:
+        index: Posição global do registro
+        payload_bytes: Tamanho do campo de descrição
+    
+    Returns:
+        Registro
+    """
+    states = ('NEW', 'PENDING', 'IN_QUEUE', 'IN_PROGRESS', 'COMPLETED', 'CRITICAL')
+    return {
+        'id': index,
+        'timestamp': f"2026-02-03T{(index // 60) % 24:02d}:{index % 60:02d}:00",
+        'state': states[index % len(states)],
+        'description': ('x' * payload_bytes),
+        'department': f"Área {index % 7}",
+        'assignee': f"Técnico {index % 13}"
+    }
+
+
+def make_handler(config: MockAPIConfig):
+    """Cria a classe de handler ligada a uma configuração"""
+    
+    class MockAPIHandler(BaseHTTPRequestHandler):
+        """Responde GET com paginação por page/per_page, cursor e header Link"""
+        
+        protocol_version = 'HTTP/1.1'
+        # Evita o atraso Nagle/delayed-ACK entre headers e corpo
+        disable_nagle_algorithm = True
+        
+        def log_message(self, format, *args):
+            pass
+        
+        def _send(self, status: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+        
+        def do_GET(self):
+            config.count('requests')
+            time.sleep(config.latency_ms / 1000)
+            
+            if config.throttle_rate and config.should_throttle():
+                config.count('throttled')
+                self._send(429, headers={'Retry-After': str(config.retry_after)})
+                return
+            
+            parsed = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+            per_page = min(int(query.get('per_page', config.page_size)), config.page_size)
+            
+            # Cursor tem precedência sobre page (cursor = offset do próximo registro)
+            if 'cursor' in query:
+                start = int(query['cursor'])
+            else:
+                start = (int(query.get('page', 1)) - 1) * per_page
+            
+            end = min(start + per_page, config.total_records)
+            records = [build_record(i, config.payload_bytes) for i in range(start, end)]
+            has_next = end < config.total_records
+            
+            body = json.dumps({
+                'data': records,
+                'next_cursor': str(end) if has_next else None
+            }).encode('utf-8')
+            
+            headers = {'Content-Type': 'application/json'}
+            if has_next:
+                next_query = dict(query, page=(end // per_page) + 1, per_page=per_page)
+                next_query.pop('cursor', None)
+                host = self.headers.get('Host', 'localhost')
+                headers['Link'] = f'<http://{host}{parsed.path}?{urlencode(next_query)}>; rel="next"'
+            
+            if config.etag:
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                headers['ETag'] = etag
+                if self.headers.get('If-None-Match') == etag:
+                    config.count('not_modified')
+                    self._send(304, headers={'ETag': etag})
+                    return
+            
+            config.count('ok')
+            self._send(200, body, headers)
+    
+    return MockAPIHandler
+
+
+class MockAPIServer:
+    """Servidor HTTP multithread executado em segundo plano"""
+    
+    def __init__(self, config: Optional[MockAPIConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            config: Parâmetros do servidor simulado
+            host: Endereço de escuta
+            port: Porta (0 = escolhida pelo sistema)
+        """
+        self.config = config or MockAPIConfig()
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(self.config))
+        self.httpd.daemon_threads = True
+        self.thread = None
+    
+    @property
+    def base_url(self) -> str:
+        """URL base para configurar o APIClient"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'MockAPIServer':
+        """Inicia o servidor em uma thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        """Encerra o servidor"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def __enter__(self) -> 'MockAPIServer':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# Execução standalone
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor REST simulado da Fonte 2")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--payload-bytes', type=int, default=200)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--no-etag', action='store_true')
+    args = parser.parse_args()
+    
+    server = MockAPIServer(
+        MockAPIConfig(
+            total_pages=args.pages,
+            page_size=args.page_size,
+            latency_ms=args.latency_ms,
+            payload_bytes=args.payload_bytes,
+            throttle_rate=args.throttle_rate,
+            etag=not args.no_etag
+        ),
+        port=args.port
+    )
+    print(f"Servidor simulado em {server.base_url}/dados (Ctrl+C para encerrar)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
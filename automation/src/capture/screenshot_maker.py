@@ -4,30 +4,53 @@ Captura de Screenshot usando Selenium
 import os
 import time
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from typing import Optional
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+from ..utils.driver_provider import DriverProvider
 
 
 class ScreenshotMaker:
     """Captura screenshots de páginas HTML"""
     
-    def __init__(self, config: dict, logger: logging.Logger):
+    def __init__(self, config: dict, logger: logging.Logger,
+                 driver_provider: Optional[DriverProvider] = None):
         """
         Inicializa o capturador de screenshots
         
         Args:
             config: Configuração de screenshot
             logger: Logger configurado
+            driver_provider: Provedor de ChromeDriver compartilhado (cria um se None)
         """
         self.config = config
         self.logger = logger
+        self.driver_provider = driver_provider or DriverProvider({}, logger)
         self.driver = None
+        self.keep_driver = config.get('keep_driver', False)
     
     def _setup_driver(self):
-        """Configura o driver do Selenium para screenshot"""
-        chrome_options = Options()
+        """Configura o driver do Selenium para screenshot (reutiliza o aberto com `keep_driver`)"""
+        if self.driver is not None:
+            return
+        
+        chrome_options = self.driver_provider.get_options('screenshot', self._build_options)
+        
+        # Inicializar driver
+        self.driver = self.driver_provider.create_driver(chrome_options)
+        
+        width = self.config.get('width', 1920)
+        height = self.config.get('height', 1080)
+        scale = self.config.get('scale', 2)
+        self.logger.info(f"Driver configurado: {width}x{height} (escala {scale}x)")
+    
+    def _build_options(self, chrome_options: Options):
+        """
+        Preenche as opções do Chrome para screenshot
+        
+        Args:
+            chrome_options: Options a configurar
+        """
         chrome_options.add_argument('--headless')  # Modo sem interface
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -41,12 +64,6 @@ class ScreenshotMaker:
         # Alta resolução
         scale = self.config.get('scale', 2)
         chrome_options.add_argument(f'--force-device-scale-factor={scale}')
-        
-        # Inicializar driver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        self.logger.info(f"Driver configurado: {width}x{height} (escala {scale}x)")
     
     def capture_html_table(self, html_path: str, output_path: Optional[str] = None) -> str:
         """
@@ -97,10 +114,12 @@ class ScreenshotMaker:
             
         except Exception as e:
             self.logger.error(f"Erro ao capturar screenshot: {e}")
+            self.close()
             raise
         
         finally:
-            self.close()
+            if not self.keep_driver:
+                self.close()
     
     def capture_element(self, html_path: str, element_id: str, output_path: Optional[str] = None) -> str:
         """
@@ -155,15 +174,18 @@ class ScreenshotMaker:
             
         except Exception as e:
             self.logger.error(f"Erro ao capturar screenshot do elemento: {e}")
+            self.close()
             raise
         
         finally:
-            self.close()
+            if not self.keep_driver:
+                self.close()
     
     def close(self):
         """Fecha o driver"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
             self.logger.info("Driver fechado")
 
 
@@ -178,7 +200,8 @@ if __name__ == "__main__":
     
     logger = setup_logger('screenshot_test', config['logging'])
     
-    maker = ScreenshotMaker(config['screenshot'], logger)
+    from src.utils.driver_provider import DriverProvider
+    maker = ScreenshotMaker(config['screenshot'], logger, DriverProvider(config.get('browser', {}), logger))
     
     # Teste (requer HTML existente)
     html_file = 'output/test.html'
@@ -1,10 +1,33 @@
 """
 Cliente de API REST para Fonte 2
 """
+import time
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from urllib.parse import urljoin
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from tenacity import retry, stop_after_attempt, wait_exponential, RetryCallState
+
+from . import json_decoder
+from .http_cache import HTTPCache
+from .rate_limiter import RequestScheduler, ThrottledError, THROTTLE_STATUS, parse_retry_after
+from .sync_state import SyncState
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Espera entre tentativas: respeita Retry-After, senão backoff exponencial"""
+    exception = retry_state.outcome.exception()
+    if isinstance(exception, ThrottledError) and exception.retry_after:
+        return exception.retry_after
+    return wait_exponential(min=2, max=10)(retry_state)
+
+
+def _before_retry(retry_state: RetryCallState):
+    """Contabiliza a nova tentativa no agendador do cliente"""
+    retry_state.args[0].scheduler.on_retry()
 
 
 class APIClient:
@@ -22,7 +45,82 @@ class APIClient:
         self.logger = logger
         self.base_url = config.get('base_url', '').rstrip('/')
         self.session = requests.Session()
+        # Indica se a última busca percorreu todas as páginas sem erro
+        self.last_fetch_ok = True
+        # Métricas por página (bytes/latência) da última busca
+        self.page_stats: List[Dict[str, Any]] = []
+        self._stats_lock = threading.Lock()
+        self._setup_pool()
         self._setup_auth()
+        
+        # Ritmo e concorrência adaptativos (429/503, Retry-After)
+        self.scheduler = RequestScheduler(
+            config.get('rate_limit', {}),
+            max(1, int(config.get('pagination', {}).get('concurrency', 1))),
+            logger
+        )
+        
+        # Cache HTTP validado por ETag / Last-Modified
+        cache_config = config.get('cache', {})
+        self.cache = HTTPCache(cache_config, logger) if cache_config.get('enabled', False) else None
+        
+        # Caminhos no JSON compilados uma única vez
+        pagination = config.get('pagination', {})
+        self._records_path = self._compile_path(pagination.get('records_path'))
+        self._cursor_path = self._compile_path(pagination.get('cursor_path', 'next_cursor'))
+        
+        # Decodificação incremental: o array em `stream_prefix` já é a lista de registros
+        self._stream_prefix = config.get('decoding', {}).get('stream_prefix') if json_decoder.HAS_IJSON else None
+        if self._stream_prefix and pagination.get('enabled', False) and pagination.get('mode', 'page') == 'cursor':
+            # O cursor fica fora do array e seria descartado pelo stream
+            self.logger.warning("decoding.stream_prefix ignorado com pagination.mode: cursor")
+            self._stream_prefix = None
+    
+    @staticmethod
+    def _compile_path(path: Optional[str]) -> Optional[Tuple[Any, ...]]:
+        """
+        Compila um caminho pontuado ('data.items', 'meta.0.cursor') em chaves/índices
+        
+        Args:
+            path: Caminho separado por pontos
+        
+        Returns:
+            Tupla de chaves (int para índices de lista) ou None
+        """
+        if not path:
+            return None
+        return tuple(int(part) if part.isdigit() else part for part in path.split('.'))
+    
+    @staticmethod
+    def _resolve_path(data: Any, path: Tuple[Any, ...]) -> Any:
+        """
+        Resolve um caminho compilado no JSON
+        
+        Args:
+            data: JSON decodificado
+            path: Caminho compilado por `_compile_path`
+        
+        Returns:
+            Valor encontrado ou None
+        """
+        for part in path:
+            if isinstance(part, int) and isinstance(data, list):
+                data = data[part] if part < len(data) else None
+            elif isinstance(data, dict):
+                data = data.get(part)
+            else:
+                return None
+            if data is None:
+                return None
+        return data
+    
+    def _setup_pool(self):
+        """Dimensiona o pool de conexões conforme a concorrência da paginação"""
+        concurrency = int(self.config.get('pagination', {}).get('concurrency', 1))
+        pool_size = max(concurrency, 10)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def _setup_auth(self):
         """Configura autenticação da API"""
@@ -55,131 +153,545 @@ class APIClient:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        
+        # Negociação explícita de compressão
+        if self.config.get('decoding', {}).get('compression', True):
+            self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        else:
+            self.session.headers['Accept-Encoding'] = 'identity'
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
+    def _build_url(self, endpoint: str) -> str:
+        """Monta a URL completa (URLs absolutas são usadas como estão)"""
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
+        return f"{self.base_url}{endpoint}"
+    
+    @retry(stop=stop_after_attempt(3), wait=_wait_for_retry, before_sleep=_before_retry)
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
-        Faz requisição HTTP com retry
+        Faz requisição HTTP com retry, sob controle do agendador adaptativo
+        
+        Respostas 429/503 reduzem a concorrência e pausam novas requisições
+        pelo Retry-After informado antes da próxima tentativa.
         
         Args:
             method: Método HTTP (GET, POST, etc.)
-            endpoint: Endpoint da API
+            endpoint: Endpoint da API ou URL absoluta (ex.: Link rel="next")
             **kwargs: Argumentos adicionais para requests
         
         Returns:
             Response object
         """
-        url = f"{self.base_url}{endpoint}"
+        url = self._build_url(endpoint)
         timeout = self.config.get('timeout', 30)
         
         self.logger.debug(f"{method} {url}")
         
-        response = self.session.request(
-            method=method,
-            url=url,
-            timeout=timeout,
-            **kwargs
-        )
+        with self.scheduler.slot():
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    timeout=timeout,
+                    **kwargs
+                )
+            except requests.RequestException:
+                self.scheduler.on_failure()
+                raise
+        
+        if response.status_code in THROTTLE_STATUS:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self.scheduler.on_throttle(retry_after)
+            response.close()
+            raise ThrottledError(
+                f"{response.status_code} para {url}", retry_after=retry_after, response=response
+            )
         
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            self.scheduler.on_failure()
+            raise
+        
+        self.scheduler.on_success()
         return response
     
-    def fetch_data(self, endpoint: Optional[str] = None, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    def _decode_response(self, response: requests.Response) -> Any:
         """
-        Busca dados da API com suporte a paginação
+        Decodifica o corpo JSON e registra bytes/latência da página
+        
+        Usa orjson quando instalado (`decoding.fast_json`) e, se
+        `decoding.stream_prefix` estiver configurado e o ijson disponível,
+        decodifica o array incrementalmente direto de `response.raw`.
         
         Args:
-            endpoint: Endpoint específico (usa default do config se None)
-            params: Parâmetros de query adicionais
+            response: Resposta HTTP (com stream=True se incremental)
         
         Returns:
-            Lista de registros
+            JSON decodificado
         """
-        if endpoint is None:
-            endpoint = self.config.get('endpoints', {}).get('data', '/dados')
+        fast = self.config.get('decoding', {}).get('fast_json', True)
         
-        params = params or {}
-        all_data = []
+        start = time.perf_counter()
+        try:
+            if self._stream_prefix:
+                response.raw.decode_content = True
+                data = list(json_decoder.iter_items(response.raw, self._stream_prefix))
+                body_bytes = None
+            else:
+                body = response.content
+                body_bytes = len(body)
+                data = json_decoder.loads(body, fast=fast)
+            wire_bytes = response.raw.tell() if response.raw is not None else body_bytes
+        finally:
+            response.close()
+        decode_ms = (time.perf_counter() - start) * 1000
         
-        # Verificar se paginação está habilitada
+        self._record_stats(response, wire_bytes, body_bytes, decode_ms)
+        return data
+    
+    def _record_stats(self, response: requests.Response, wire_bytes: Optional[int],
+                      body_bytes: Optional[int], decode_ms: float):
+        """Registra as métricas de uma página"""
+        stats = {
+            'url': response.url,
+            'status': response.status_code,
+            'encoding': response.headers.get('Content-Encoding', 'identity'),
+            'wire_bytes': wire_bytes,
+            'body_bytes': body_bytes,
+            'latency_ms': response.elapsed.total_seconds() * 1000,
+            'decode_ms': decode_ms
+        }
+        with self._stats_lock:
+            self.page_stats.append(stats)
+        
+        self.logger.debug(
+            f"Página {response.status_code}: {wire_bytes} bytes ({stats['encoding']}), "
+            f"latência {stats['latency_ms']:.0f} ms, decode {decode_ms:.0f} ms"
+        )
+    
+    def _log_stats_summary(self):
+        """Registra o resumo das métricas da última busca"""
+        counters = self.scheduler.stats()
+        self.logger.info(
+            f"Requisições: {counters['succeeded']} ok, {counters['throttled']} limitadas, "
+            f"{counters['retried']} repetidas, {counters['failed']} falhas "
+            f"(concorrência atual {counters['concurrency']})"
+        )
+        
+        if not self.page_stats:
+            return
+        
+        wire = sum(s['wire_bytes'] or 0 for s in self.page_stats)
+        latency = sum(s['latency_ms'] for s in self.page_stats)
+        decode = sum(s['decode_ms'] for s in self.page_stats)
+        self.logger.info(
+            f"Métricas: {len(self.page_stats)} respostas, {wire / 1024:.1f} KB transferidos, "
+            f"latência total {latency:.0f} ms, decode total {decode:.0f} ms "
+            f"({json_decoder.decoder_name(self.config.get('decoding', {}).get('fast_json', True))})"
+        )
+    
+    @staticmethod
+    def _response_links(response: requests.Response) -> Dict[str, Dict[str, str]]:
+        """Links do header Link com as URLs relativas resolvidas contra a URL da resposta"""
+        return {
+            rel: {**link, 'url': urljoin(response.url, link['url'])}
+            for rel, link in response.links.items()
+        }
+    
+    def _request_json(self, endpoint: str, params: Optional[Dict] = None) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """
+        Faz GET e retorna o JSON e os links do header Link, usando o cache HTTP quando habilitado
+        
+        Com cache, a requisição é condicional (If-None-Match / If-Modified-Since)
+        e uma resposta 304 devolve o payload já armazenado sem novo download.
+        
+        Args:
+            endpoint: Endpoint da API ou URL absoluta
+            params: Parâmetros de query
+        
+        Returns:
+            Tupla (JSON decodificado, links RFC 5988 por rel, com URLs absolutas)
+        """
+        stream = bool(self._stream_prefix)
+        
+        if self.cache is None:
+            response = self._make_request('GET', endpoint, params=params, stream=stream)
+            return self._decode_response(response), self._response_links(response)
+        
+        url = self._build_url(endpoint)
+        entry = self.cache.get(url, params)
+        headers = self.cache.conditional_headers(entry)
+        
+        response = self._make_request('GET', endpoint, params=params, headers=headers, stream=stream)
+        
+        if response.status_code == 304 and entry is not None:
+            self.logger.debug(f"304 Not Modified, usando cache: {url}")
+            self._record_stats(response, 0, 0, 0.0)
+            response.close()
+            self.cache.touch(url, params)
+            return entry['payload'], entry.get('links') or {}
+        
+        data = self._decode_response(response)
+        links = self._response_links(response)
+        self.cache.store(url, params, response.headers, data, links=links)
+        return data, links
+    
+    def _extract_records(self, data: Any) -> List[Dict[str, Any]]:
+        """
+        Extrai a lista de registros do payload da API
+        
+        Args:
+            data: JSON decodificado da resposta
+        
+        Returns:
+            Lista de registros (vazia se não encontrada)
+        """
+        # Decodificação incremental: o payload já é o array de `stream_prefix`
+        if self._stream_prefix:
+            return data if isinstance(data, list) else []
+        
+        # Caminho configurado em pagination.records_path
+        if self._records_path is not None:
+            records = self._resolve_path(data, self._records_path)
+            return records if isinstance(records, list) else []
+        
+        # Extrair dados (ajustar conforme estrutura da API)
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            # Tentar encontrar lista de registros
+            return (
+                data.get('data') or 
+                data.get('results') or 
+                data.get('items') or 
+                []
+            )
+        return []
+    
+    def _fetch_page(self, endpoint: str, params: Dict, page: int) -> List[Dict[str, Any]]:
+        """
+        Busca uma única página da API
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros de query (já com per_page)
+            page: Número da página
+        
+        Returns:
+            Registros da página
+        """
         pagination = self.config.get('pagination', {})
-        use_pagination = pagination.get('enabled', False)
+        page_params = dict(params)
+        page_params[pagination.get('page_param', 'page')] = page
         
-        if use_pagination:
-            page_param = pagination.get('page_param', 'page')
-            per_page_param = pagination.get('per_page_param', 'per_page')
-            per_page = pagination.get('per_page', 100)
-            max_pages = pagination.get('max_pages', 10)
+        self.logger.info(f"Buscando página {page}")
+        data, _ = self._request_json(endpoint, page_params)
+        return self._extract_records(data)
+    
+    def _iter_pages_concurrent(self, endpoint: str, params: Dict, per_page: int,
+                               max_pages: int, concurrency: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Gera páginas mantendo até `concurrency` requisições simultâneas
+        
+        As páginas são entregues em ordem; ao encontrar uma página vazia ou
+        incompleta, as requisições posteriores ainda pendentes são descartadas.
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros de query (já com per_page)
+            per_page: Registros por página
+            max_pages: Limite de páginas
+            concurrency: Número máximo de requisições em andamento
+        
+        Yields:
+            Registros de cada página, na ordem das páginas
+        """
+        futures = {}
+        next_page = 1
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        
+            def submit_next():
+                nonlocal next_page
+                if next_page <= max_pages:
+                    futures[next_page] = executor.submit(self._fetch_page, endpoint, params, next_page)
+                    next_page += 1
             
-            # Paginação
-            current_page = 1
+            for _ in range(concurrency):
+                submit_next()
             
-            while current_page <= max_pages:
-                params[page_param] = current_page
-                params[per_page_param] = per_page
-                
-                self.logger.info(f"Buscando página {current_page}")
-                
-                try:
-                    response = self._make_request('GET', endpoint, params=params)
-                    data = response.json()
-                    
-                    # Extrair dados (ajustar conforme estrutura da API)
-                    if isinstance(data, list):
-                        records = data
-                    elif isinstance(data, dict):
-                        # Tentar encontrar lista de registros
-                        records = (
-                            data.get('data') or 
-                            data.get('results') or 
-                            data.get('items') or 
-                            []
-                        )
-                    else:
-                        records = []
+            current_page = 1
+            try:
+                while current_page in futures:
+                    try:
+                        records = futures.pop(current_page).result()
+                    except Exception as e:
+                        self.logger.error(f"Erro ao buscar página {current_page}: {e}")
+                        self.last_fetch_ok = False
+                        break
                     
                     if not records:
                         self.logger.info("Nenhum registro retornado, finalizando paginação")
                         break
                     
-                    all_data.extend(records)
-                    self.logger.info(f"✓ {len(records)} registros obtidos (total: {len(all_data)})")
+                    # Já dispara a próxima antes de entregar a página atual
+                    current_page += 1
+                    submit_next()
+                    yield records
                     
-                    # Verificar se há mais páginas
                     if len(records) < per_page:
                         self.logger.info("Última página alcançada")
                         break
-                    
-                    current_page += 1
-                    
+            finally:
+                # Descartar páginas além do fim
+                for future in futures.values():
+                    future.cancel()
+    
+    def _next_request(self, mode: str, request: Tuple[str, Optional[Dict]], data: Any,
+                      links: Dict[str, Dict[str, str]], records: List[Dict[str, Any]],
+                      per_page: int) -> Optional[Tuple[str, Optional[Dict]]]:
+        """
+        Determina a próxima requisição conforme o modo de paginação
+        
+        Args:
+            mode: 'page', 'cursor' ou 'link'
+            request: Requisição atual (endpoint/URL, params)
+            data: JSON da resposta atual
+            links: Links do header Link da resposta atual
+            records: Registros extraídos da resposta atual
+            per_page: Registros por página
+        
+        Returns:
+            Próxima requisição ou None se for a última página
+        """
+        pagination = self.config.get('pagination', {})
+        endpoint, params = request
+        
+        if mode == 'cursor':
+            cursor = self._resolve_path(data, self._cursor_path)
+            if not cursor:
+                return None
+            next_params = dict(params or {})
+            next_params[pagination.get('cursor_param', 'cursor')] = cursor
+            return endpoint, next_params
+        
+        if mode == 'link':
+            next_url = links.get('next', {}).get('url')
+            # A URL do Link já carrega a query completa
+            return (next_url, None) if next_url else None
+        
+        if len(records) < per_page:
+            return None
+        page_param = pagination.get('page_param', 'page')
+        next_params = dict(params)
+        next_params[page_param] = next_params[page_param] + 1
+        return endpoint, next_params
+    
+    def _iter_pages_sequential(self, endpoint: str, params: Dict, per_page: int,
+                               max_pages: int, mode: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Gera páginas seguindo offset, cursor ou header Link
+        
+        Com `pagination.prefetch`, a requisição da próxima página é disparada
+        assim que a atual é decodificada, enquanto o consumidor processa a página.
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros de query (já com per_page)
+            per_page: Registros por página
+            max_pages: Limite de páginas
+            mode: 'page', 'cursor' ou 'link'
+        
+        Yields:
+            Registros de cada página
+        """
+        pagination = self.config.get('pagination', {})
+        prefetch = pagination.get('prefetch', True)
+        
+        request = (endpoint, dict(params))
+        if mode == 'page':
+            request[1][pagination.get('page_param', 'page')] = 1
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        future = None
+        current_page = 1
+        
+        try:
+            while request is not None and current_page <= max_pages:
+                self.logger.info(f"Buscando página {current_page}")
+                try:
+                    if future is not None:
+                        data, links = future.result()
+                    else:
+                        data, links = self._request_json(*request)
                 except Exception as e:
                     self.logger.error(f"Erro ao buscar página {current_page}: {e}")
+                    self.last_fetch_ok = False
                     break
+                
+                records = self._extract_records(data)
+                if not records:
+                    self.logger.info("Nenhum registro retornado, finalizando paginação")
+                    break
+                
+                request = self._next_request(mode, request, data, links, records, per_page)
+                current_page += 1
+                
+                # Dispara a próxima página antes de entregar a atual
+                future = None
+                if executor is not None and request is not None and current_page <= max_pages:
+                    future = executor.submit(self._request_json, *request)
+                
+                yield records
+                
+                if request is None:
+                    self.logger.info("Última página alcançada")
+        finally:
+            if future is not None:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    def iter_pages(self, endpoint: Optional[str] = None, params: Optional[Dict] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Busca dados da API página a página, sem acumular o resultado
+        
+        Args:
+            endpoint: Endpoint específico (usa default do config se None)
+            params: Parâmetros de query adicionais
+        
+        Yields:
+            Lista de registros de cada página
+        """
+        if endpoint is None:
+            endpoint = self.config.get('endpoints', {}).get('data', '/dados')
+        
+        params = dict(params or {})
+        self.last_fetch_ok = True
+        self.page_stats = []
+        self.scheduler.reset_counters()
+        
+        # Verificar se paginação está habilitada
+        pagination = self.config.get('pagination', {})
+        use_pagination = pagination.get('enabled', False)
+        
+        if use_pagination:
+            per_page_param = pagination.get('per_page_param', 'per_page')
+            per_page = pagination.get('per_page', 100)
+            max_pages = pagination.get('max_pages', 10)
+            concurrency = max(1, int(pagination.get('concurrency', 1)))
+            mode = pagination.get('mode', 'page')
+            
+            params[per_page_param] = per_page
+            
+            if mode not in ('page', 'cursor', 'link'):
+                raise ValueError(f"Modo de paginação não suportado: {mode}")
+            
+            if concurrency > 1 and mode == 'page':
+                self.logger.info(f"Paginação concorrente: até {concurrency} requisições simultâneas")
+                yield from self._iter_pages_concurrent(endpoint, params, per_page, max_pages, concurrency)
+                return
+            
+            if concurrency > 1:
+                self.logger.info(f"Paginação por {mode} é sequencial; concorrência ignorada")
+            
+            yield from self._iter_pages_sequential(endpoint, params, per_page, max_pages, mode)
         
         else:
             # Sem paginação - uma única requisição
             try:
-                response = self._make_request('GET', endpoint, params=params)
-                data = response.json()
-                
-                if isinstance(data, list):
-                    all_data = data
-                elif isinstance(data, dict):
-                    all_data = (
-                        data.get('data') or 
-                        data.get('results') or 
-                        data.get('items') or 
-                        []
-                    )
-                
-                self.logger.info(f"✓ {len(all_data)} registros obtidos")
-                
+                data, _ = self._request_json(endpoint, params)
+                records = self._extract_records(data)
             except Exception as e:
                 self.logger.error(f"Erro ao buscar dados: {e}")
+                self.last_fetch_ok = False
                 raise
+            
+            yield records
+    
+    def iter_records(self, endpoint: Optional[str] = None, params: Optional[Dict] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Busca dados da API registro a registro
         
+        Args:
+            endpoint: Endpoint específico (usa default do config se None)
+            params: Parâmetros de query adicionais
+        
+        Yields:
+            Registros individuais
+        """
+        for records in self.iter_pages(endpoint, params):
+            yield from records
+    
+    def fetch_data(self, endpoint: Optional[str] = None, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Busca dados da API com suporte a paginação
+        
+        Args:
+            endpoint: Endpoint específico (usa default do config se None)
+            params: Parâmetros de query adicionais
+        
+        Returns:
+            Lista de registros
+        """
+        if self.config.get('incremental', {}).get('enabled', False):
+            return self.fetch_incremental(endpoint, params)
+        
+        all_data = []
+        
+        for records in self.iter_pages(endpoint, params):
+            all_data.extend(records)
+            self.logger.info(f"✓ {len(records)} registros obtidos (total: {len(all_data)})")
+        
+        self._log_stats_summary()
         return all_data
     
+    def fetch_incremental(self, endpoint: Optional[str] = None, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Busca apenas registros novos desde o último watermark e os aplica ao snapshot local
+        
+        O watermark só é avançado quando todas as páginas foram obtidas sem erro,
+        para que uma execução parcial seja repetida por completo na próxima vez.
+        
+        Args:
+            endpoint: Endpoint específico (usa default do config se None)
+            params: Parâmetros de query adicionais
+        
+        Returns:
+            Snapshot consolidado (dados anteriores + delta)
+        """
+        incremental = self.config.get('incremental', {})
+        state = SyncState(incremental, self.logger)
+        since_param = incremental.get('since_param', 'updated_since')
+        
+        params = dict(params or {})
+        watermark = state.load_watermark()
+        
+        if watermark is not None:
+            params[since_param] = watermark
+            self.logger.info(f"Sincronização incremental a partir de {since_param}={watermark}")
+        else:
+            self.logger.info("Nenhum watermark salvo, executando carga completa")
+        
+        delta = []
+        for records in self.iter_pages(endpoint, params):
+            delta.extend(records)
+        
+        self.logger.info(f"✓ {len(delta)} registros novos/alterados obtidos")
+        self._log_stats_summary()
+        
+        if not self.last_fetch_ok:
+            self.logger.warning("Busca incompleta: watermark e snapshot mantidos")
+            return state.load_snapshot()
+        
+        snapshot = state.merge_snapshot(delta)
+        new_watermark = state.max_watermark(delta, watermark)
+        if new_watermark is not None and new_watermark != watermark:
+            state.save_watermark(new_watermark)
+        
+        return snapshot
+    
     def close(self):
         """Fecha a sessão"""
         self.session.close()
@@ -0,0 +1,150 @@
+"""
+Sessão de navegador persistente - reaproveita o Chrome e os cookies autenticados
+"""
+import os
+import json
+import time
+import logging
+from typing import Callable, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class BrowserSession:
+    """Mantém um driver Selenium aquecido entre execuções e persiste os cookies em disco"""
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa o gerenciador de sessão
+        
+        Args:
+            config: Configuração `fonte1.session`
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.enabled = config.get('enabled', False)
+        self.max_uses = int(config.get('max_uses', 20))
+        self.cookie_file = config.get('cookie_file', 'temp/fonte1_cookies.json')
+        self.cookie_ttl = float(config.get('cookie_ttl_minutes', 60)) * 60
+        self.driver: Optional[WebDriver] = None
+        self.uses = 0
+    
+    def acquire(self, factory: Callable[[], WebDriver]) -> WebDriver:
+        """
+        Obtém o driver aquecido, criando um novo se necessário
+        
+        Args:
+            factory: Função que cria um novo driver
+        
+        Returns:
+            Driver pronto para uso
+        """
+        if self.driver is not None and self.uses >= self.max_uses:
+            self.logger.info(f"Navegador atingiu {self.uses} usos, reciclando")
+            self.recycle()
+        
+        if self.driver is None:
+            self.driver = factory()
+            self.uses = 0
+        else:
+            self.logger.info(f"Reutilizando navegador aquecido (uso {self.uses + 1}/{self.max_uses})")
+        
+        self.uses += 1
+        return self.driver
+    
+    def release(self, failed: bool = False):
+        """
+        Devolve o driver após uma execução
+        
+        Args:
+            failed: Se a execução falhou (o navegador é descartado)
+        """
+        if failed:
+            self.logger.info("Execução falhou, descartando navegador")
+            self.recycle()
+    
+    def recycle(self):
+        """Encerra o navegador atual; o próximo acquire cria um novo"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                self.logger.warning(f"Erro ao encerrar navegador: {e}")
+            self.driver = None
+            self.uses = 0
+    
+    def save_cookies(self, driver: Optional[WebDriver] = None):
+        """
+        Grava os cookies da sessão autenticada em disco
+        
+        Args:
+            driver: Driver de origem (usa o driver da sessão se None)
+        """
+        driver = driver or self.driver
+        if driver is None:
+            return
+        
+        directory = os.path.dirname(self.cookie_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        payload = {'saved_at': time.time(), 'cookies': driver.get_cookies()}
+        tmp_path = f"{self.cookie_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.cookie_file)
+        self.logger.info(f"Cookies da sessão salvos ({len(payload['cookies'])})")
+    
+    def load_cookies(self) -> list:
+        """
+        Lê os cookies salvos, se ainda estiverem dentro da validade
+        
+        Returns:
+            Lista de cookies (vazia se ausentes ou expirados)
+        """
+        if not os.path.exists(self.cookie_file):
+            return []
+        
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Arquivo de cookies ilegível, ignorando: {e}")
+            return []
+        
+        if time.time() - payload.get('saved_at', 0) > self.cookie_ttl:
+            self.logger.info("Cookies salvos expirados")
+            return []
+        
+        now = time.time()
+        return [c for c in payload.get('cookies', []) if c.get('expiry', now + 1) > now]
+    
+    def restore_cookies(self) -> bool:
+        """
+        Injeta os cookies salvos no navegador (a página do domínio deve estar aberta)
+        
+        Returns:
+            True se algum cookie foi restaurado
+        """
+        cookies = self.load_cookies()
+        if self.driver is None or not cookies:
+            return False
+        
+        restored = 0
+        for cookie in cookies:
+            # sameSite inválido é rejeitado pelo Chrome
+            if cookie.get('sameSite') not in ('Strict', 'Lax', 'None'):
+                cookie.pop('sameSite', None)
+            try:
+                self.driver.add_cookie(cookie)
+                restored += 1
+            except Exception as e:
+                self.logger.debug(f"Cookie {cookie.get('name')} não restaurado: {e}")
+        
+        self.logger.info(f"{restored} cookies restaurados da sessão anterior")
+        return restored > 0
+    
+    def clear_cookies(self):
+        """Remove o arquivo de cookies (sessão inválida)"""
+        if os.path.exists(self.cookie_file):
+            os.remove(self.cookie_file)
@@ -0,0 +1,166 @@
+"""
+Cache HTTP em disco com validação por ETag / Last-Modified
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+
+class HTTPCache:
+    """Cache de respostas JSON validado por requisições condicionais"""
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa o cache
+        
+        Args:
+            config: Configuração `fonte2.cache`
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.cache_dir = config.get('dir', 'temp/http_cache')
+        self.max_bytes = int(config.get('max_mb', 50)) * 1024 * 1024
+        self._lock = threading.Lock()
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _key(self, url: str, params: Optional[Dict]) -> str:
+        """Gera a chave do cache a partir da URL e dos parâmetros"""
+        raw = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """Caminho do arquivo de uma entrada"""
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """
+        Obtém uma entrada do cache
+        
+        Args:
+            url: URL requisitada
+            params: Parâmetros de query
+        
+        Returns:
+            Entrada com 'etag', 'last_modified', 'links' e 'payload', ou None
+        """
+        path = self._path(self._key(url, params))
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Entrada de cache inválida descartada ({path}): {e}")
+            self._remove(path)
+            return None
+    
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Monta os headers de validação condicional para uma entrada
+        
+        Args:
+            entry: Entrada do cache (ou None)
+        
+        Returns:
+            Headers If-None-Match / If-Modified-Since
+        """
+        headers = {}
+        if not entry:
+            return headers
+        
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def touch(self, url: str, params: Optional[Dict] = None):
+        """
+        Marca uma entrada como usada recentemente (LRU)
+        
+        Args:
+            url: URL requisitada
+            params: Parâmetros de query
+        """
+        path = self._path(self._key(url, params))
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    
+    def store(self, url: str, params: Optional[Dict], headers: Dict[str, str], payload: Any,
+              links: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        Armazena uma resposta se ela tiver validadores
+        
+        Args:
+            url: URL requisitada
+            params: Parâmetros de query
+            headers: Headers da resposta
+            payload: JSON decodificado
+            links: Links do header Link (paginação por link)
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        
+        if not etag and not last_modified:
+            return
+        
+        path = self._path(self._key(url, params))
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'links': links or {},
+            'payload': payload
+        }
+        
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+        
+        self._evict()
+    
+    def _remove(self, path: str):
+        """Remove um arquivo ignorando concorrência"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _evict(self):
+        """Remove as entradas menos usadas até respeitar o limite de tamanho"""
+        with self._lock:
+            entries = []
+            total = 0
+            
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            
+            if total <= self.max_bytes:
+                return
+            
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+                removed += 1
+            
+            self.logger.debug(f"Cache HTTP: {removed} entradas removidas (LRU)")
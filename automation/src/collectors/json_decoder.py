@@ -0,0 +1,68 @@
+"""
+Decodificação JSON plugável - orjson quando instalado, stdlib como fallback
+"""
+import json
+from typing import Any, Iterator, IO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - dependência opcional
+    ijson = None
+
+
+HAS_ORJSON = orjson is not None
+HAS_IJSON = ijson is not None
+
+
+def decoder_name(fast: bool = True) -> str:
+    """
+    Nome do decodificador efetivamente usado
+    
+    Args:
+        fast: Se o decodificador rápido foi solicitado
+    
+    Returns:
+        'orjson' ou 'json'
+    """
+    return 'orjson' if fast and HAS_ORJSON else 'json'
+
+
+def loads(data: bytes, fast: bool = True) -> Any:
+    """
+    Decodifica um corpo JSON
+    
+    Args:
+        data: Corpo da resposta (bytes)
+        fast: Usar orjson quando disponível
+    
+    Returns:
+        Objeto decodificado
+    """
+    if fast and HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_items(stream: IO[bytes], prefix: str = 'item') -> Iterator[Any]:
+    """
+    Decodifica incrementalmente os elementos de um array JSON a partir de um stream
+    
+    Requer ijson; `prefix` segue a sintaxe do ijson ('item' para array na raiz,
+    'data.item' para o array em {"data": [...]}).
+    
+    Args:
+        stream: Stream binário (ex.: response.raw)
+        prefix: Caminho do array no documento
+    
+    Yields:
+        Elementos do array
+    """
+    if not HAS_IJSON:
+        raise RuntimeError("ijson não instalado - decodificação incremental indisponível")
+    
+    yield from ijson.items(stream, prefix, use_float=True)
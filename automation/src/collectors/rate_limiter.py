@@ -0,0 +1,183 @@
+"""
+Agendador de requisições adaptativo - token bucket + concorrência AIMD
+"""
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+import requests
+
+
+THROTTLE_STATUS = (429, 503)
+
+
+class ThrottledError(requests.HTTPError):
+    """Resposta 429/503 do servidor, com o Retry-After informado (se houver)"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None, response=None):
+        super().__init__(message, response=response)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Converte o header Retry-After (segundos ou data HTTP) em segundos
+    
+    Args:
+        value: Valor do header
+    
+    Returns:
+        Segundos de espera ou None
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestScheduler:
+    """Controla ritmo e concorrência das requisições conforme os sinais do servidor"""
+    
+    def __init__(self, config: dict, max_concurrency: int, logger: logging.Logger):
+        """
+        Inicializa o agendador
+        
+        Args:
+            config: Configuração `fonte2.rate_limit`
+            max_concurrency: Teto de requisições simultâneas
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(int(config.get('min_concurrency', 1)), self.max_concurrency))
+        self.decrease_factor = float(config.get('decrease_factor', 0.5))
+        
+        # Limite AIMD (fracionário; a parte inteira é o número de vagas)
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        
+        # Token bucket (rate <= 0 desativa)
+        self.rate = float(config.get('requests_per_second', 0) or 0)
+        self.burst = float(config.get('burst', max(1, self.max_concurrency)))
+        self.tokens = self.burst
+        self.last_refill = time.monotonic()
+        
+        self.counters = {'succeeded': 0, 'throttled': 0, 'retried': 0, 'failed': 0}
+        self._cond = threading.Condition()
+    
+    def _refill(self, now: float):
+        """Repõe tokens proporcionalmente ao tempo decorrido"""
+        if self.rate <= 0:
+            return
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def _acquire(self):
+        """Aguarda vaga de concorrência, fim de pausa e token disponível"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                
+                wait = None
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.in_flight >= int(self.limit):
+                    wait = None
+                elif self.rate > 0 and self.tokens < 1:
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    self.in_flight += 1
+                    if self.rate > 0:
+                        self.tokens -= 1
+                    return
+                
+                self._cond.wait(timeout=wait)
+    
+    def _release(self):
+        """Libera a vaga de concorrência"""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+    
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Contexto que ocupa uma vaga durante a requisição"""
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+    
+    def on_success(self):
+        """Aumento aditivo: +1 vaga a cada `limit` respostas bem-sucedidas"""
+        with self._cond:
+            self.counters['succeeded'] += 1
+            if self.limit < self.max_concurrency:
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+                self._cond.notify_all()
+    
+    def on_throttle(self, retry_after: Optional[float]):
+        """
+        Redução multiplicativa e pausa global após 429/503
+        
+        Args:
+            retry_after: Segundos informados pelo servidor (ou None)
+        """
+        with self._cond:
+            self.counters['throttled'] += 1
+            previous = int(self.limit)
+            now = time.monotonic()
+            
+            # Respostas da mesma rajada (ainda dentro da pausa) reduzem uma vez só
+            if now >= self.paused_until:
+                self.limit = max(self.min_concurrency, self.limit * self.decrease_factor)
+            
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+        
+        self.logger.warning(
+            f"Servidor limitou requisições: concorrência {previous} → {int(self.limit)}"
+            + (f", aguardando {retry_after:.1f}s" if retry_after else "")
+        )
+    
+    def on_retry(self):
+        """Contabiliza uma nova tentativa"""
+        with self._cond:
+            self.counters['retried'] += 1
+    
+    def on_failure(self):
+        """Contabiliza uma requisição que falhou sem limitação"""
+        with self._cond:
+            self.counters['failed'] += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores e o limite atual
+        
+        Returns:
+            Dicionário com succeeded, throttled, retried, failed e concurrency
+        """
+        with self._cond:
+            return {**self.counters, 'concurrency': int(self.limit)}
+    
+    def reset_counters(self):
+        """Zera os contadores (o limite aprendido é mantido)"""
+        with self._cond:
+            self.counters = {key: 0 for key in self.counters}
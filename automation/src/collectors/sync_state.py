@@ -0,0 +1,151 @@
+"""
+Estado de sincronização incremental da Fonte 2 (watermark + snapshot local)
+"""
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+
+class SyncState:
+    """Persiste o high-water mark e o snapshot local da sincronização incremental"""
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa o estado de sincronização
+        
+        Args:
+            config: Configuração `fonte2.incremental`
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.watermark_field = config.get('watermark_field', 'timestamp')
+        self.key_field = config.get('key_field')
+        self.state_file = config.get('state_file', 'temp/fonte2_state.json')
+        self.snapshot_file = config.get('snapshot_file', 'temp/fonte2_snapshot.json')
+    
+    def _read_json(self, path: str, default: Any) -> Any:
+        """Lê um arquivo JSON, retornando `default` se não existir ou estiver corrompido"""
+        if not os.path.exists(path):
+            return default
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Estado incremental ilegível em {path}, ignorando: {e}")
+            return default
+    
+    def _write_json(self, path: str, payload: Any):
+        """Grava um arquivo JSON de forma atômica"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+    
+    def load_watermark(self) -> Optional[Any]:
+        """
+        Carrega o high-water mark da última execução bem-sucedida
+        
+        Returns:
+            Valor do watermark ou None na primeira execução
+        """
+        return self._read_json(self.state_file, {}).get('watermark')
+    
+    def save_watermark(self, watermark: Any):
+        """
+        Persiste o high-water mark
+        
+        Args:
+            watermark: Novo valor do watermark
+        """
+        self._write_json(self.state_file, {
+            'watermark': watermark,
+            'updated_at': datetime.now().isoformat(timespec='seconds')
+        })
+        self.logger.info(f"Watermark salvo: {watermark}")
+    
+    def max_watermark(self, records: List[Dict[str, Any]], current: Optional[Any] = None) -> Optional[Any]:
+        """
+        Calcula o maior valor do campo de watermark
+        
+        O campo deve ser ordenável: numérico ou texto em ISO 8601.
+        
+        Args:
+            records: Registros recebidos
+            current: Watermark atual
+        
+        Returns:
+            Maior watermark entre `current` e os registros
+        """
+        values = [r.get(self.watermark_field) for r in records]
+        values = [v for v in values if v is not None and v != '']
+        if current is not None:
+            values.append(current)
+        
+        if not values:
+            return None
+        
+        if all(isinstance(v, (int, float)) for v in values):
+            return max(values)
+        return max(str(v) for v in values)
+    
+    def load_snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Carrega o snapshot local
+        
+        Returns:
+            Lista de registros armazenados
+        """
+        return self._read_json(self.snapshot_file, [])
+    
+    def merge_snapshot(self, delta: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Aplica os registros novos ao snapshot local e o persiste
+        
+        Registros com a mesma chave (`key_field`) são substituídos pela versão
+        mais recente; sem chave configurada, o delta é apenas acrescentado.
+        Registros sem o campo da chave (ou com valor nulo) são mantidos,
+        acrescentados sem deduplicação.
+        
+        Args:
+            delta: Registros novos ou alterados
+        
+        Returns:
+            Snapshot consolidado
+        """
+        snapshot = self.load_snapshot()
+        
+        if self.key_field:
+            merged = {}
+            unkeyed = [r for r in snapshot if r.get(self.key_field) is None]
+            for record in snapshot:
+                if record.get(self.key_field) is not None:
+                    merged[record[self.key_field]] = record
+            
+            missing = 0
+            for record in delta:
+                if record.get(self.key_field) is None:
+                    unkeyed.append(record)
+                    missing += 1
+                else:
+                    merged[record[self.key_field]] = record
+            
+            if missing:
+                self.logger.warning(
+                    f"{missing} registros sem o campo '{self.key_field}' (incremental.key_field) "
+                    "acrescentados ao snapshot sem deduplicação"
+                )
+            snapshot = list(merged.values()) + unkeyed
+        else:
+            snapshot.extend(delta)
+        
+        self._write_json(self.snapshot_file, snapshot)
+        self.logger.info(f"Snapshot local atualizado: {len(snapshot)} registros")
+        return snapshot
@@ -2,39 +2,75 @@
 Web Scraper para Fonte 1 - Download de Planilha
 """
 import os
+import re
+import json
 import time
-from typing import Optional
+from typing import Optional, Set
+from urllib.parse import urlparse, unquote
 import logging
+import requests
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ..utils.driver_provider import DriverProvider
+from .browser_session import BrowserSession
+
+
+# Extensões de arquivo aceitas e sufixos de download em andamento (Chrome, Firefox, Edge)
+DOWNLOAD_EXTENSIONS = ('.xlsx', '.xls', '.csv')
+PARTIAL_SUFFIXES = ('.crdownload', '.part', '.partial', '.download', '.tmp')
+EXPORT_LINK_XPATH = "//a[contains(@href, '.xlsx') or contains(@href, '.xls')]"
+DOWNLOAD_BUTTON_XPATH = "//button[contains(text(), 'Download')]"
+
+# Recursos bloqueados no perfil rápido (imagens, fontes, mídia e analytics)
+DEFAULT_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3', '*.ogg',
+    '*google-analytics.com*', '*googletagmanager.com*', '*hotjar.com*', '*clarity.ms*'
+]
+
+
+class SessionExpiredError(Exception):
+    """O portal respondeu com a página de login em vez da planilha"""
+
 
 class WebScraper:
     """Web Scraper usando Selenium para download de planilhas"""
     
-    def __init__(self, config: dict, logger: logging.Logger):
+    def __init__(self, config: dict, logger: logging.Logger,
+                 driver_provider: Optional[DriverProvider] = None):
         """
         Inicializa o Web Scraper
         
         Args:
             config: Configuração da Fonte 1
             logger: Logger configurado
+            driver_provider: Provedor de ChromeDriver compartilhado (cria um se None)
         """
         self.config = config
         self.logger = logger
+        self.driver_provider = driver_provider or DriverProvider({}, logger)
         self.driver = None
         self.downloads_dir = None
+        
+        # Navegador aquecido e cookies reaproveitados entre execuções
+        self.browser_session = BrowserSession(config.get('session', {}), logger)
+        
+        # Sessão HTTP (pool) do download direto, criada sob demanda
+        self.http = None
     
     def _setup_driver(self, downloads_dir: str):
         """
         Configura o driver do Selenium
         
+        Com `session.enabled`, reutiliza o navegador já aberto e apenas
+        redireciona o diretório de download.
+        
         Args:
             downloads_dir: Diretório para downloads
         """
@@ -43,9 +79,61 @@ class WebScraper:
         # Criar diretório se não existir
         os.makedirs(self.downloads_dir, exist_ok=True)
         
-        # Opções do Chrome
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
+        if not self.browser_session.enabled:
+            self.driver = self._create_driver()
+            if not self._fast_profile():
+                return
+        else:
+            self.driver = self.browser_session.acquire(self._create_driver)
+        
+        # O diretório de download pode mudar entre execuções (e o headless exige liberação)
+        self.driver.execute_cdp_cmd('Page.setDownloadBehavior', {
+            'behavior': 'allow',
+            'downloadPath': self.downloads_dir
+        })
+    
+    def _create_driver(self) -> webdriver.Chrome:
+        """
+        Inicia um novo Chrome configurado para download
+        
+        Returns:
+            Driver Selenium
+        """
+        chrome_options = self.driver_provider.get_options(
+            f"scraper:{self.downloads_dir}", self._build_options
+        )
+        
+        # Inicializar driver
+        driver = self.driver_provider.create_driver(chrome_options)
+        
+        if self._fast_profile():
+            blocked = self.config.get('fast_profile', {}).get('blocked_urls', DEFAULT_BLOCKED_URLS)
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+            self.logger.info(f"Perfil rápido: headless, carregamento 'eager', {len(blocked)} padrões bloqueados")
+        
+        self.logger.info("Driver Selenium inicializado")
+        return driver
+    
+    def _fast_profile(self) -> bool:
+        """Indica se o perfil rápido (headless, sem recursos pesados) está ativo"""
+        return self.config.get('fast_profile', {}).get('enabled', False)
+    
+    def _build_options(self, chrome_options: Options):
+        """
+        Preenche as opções do Chrome para o scraper
+        
+        Args:
+            chrome_options: Options a configurar
+        """
+        if self._fast_profile():
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--disable-extensions")
+            # Retorna do get() no DOMContentLoaded, sem esperar imagens/iframes
+            chrome_options.page_load_strategy = 'eager'
+        else:
+            chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -57,18 +145,47 @@ class WebScraper:
             "download.directory_upgrade": True,
             "safebrowsing.enabled": True
         }
+        if self._fast_profile():
+            prefs["profile.managed_default_content_settings.images"] = 2
         chrome_options.add_experimental_option("prefs", prefs)
         
-        # Inicializar driver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.logger.info("Driver Selenium inicializado")
+    def _is_login_page(self) -> bool:
+        """Verifica se a página atual exibe o formulário de login"""
+        return bool(self.driver.find_elements(By.ID, "username"))
+    
+    def _session_authenticated(self) -> bool:
+        """
+        Tenta aproveitar a sessão existente (navegador aquecido ou cookies salvos)
+        
+        Returns:
+            True se a página já está autenticada
+        """
+        if not self._is_login_page():
+            self.logger.info("Sessão ainda autenticada, login ignorado")
+            return True
+        
+        if self.browser_session.restore_cookies():
+            self.driver.refresh()
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            if not self._is_login_page():
+                self.logger.info("Sessão restaurada a partir dos cookies salvos")
+                return True
+            
+            self.logger.info("Cookies salvos não são mais válidos")
+            self.browser_session.clear_cookies()
+        
+        return False
     
     def _login(self):
         """Realiza login se necessário"""
         if not self.config.get('login_required', False):
             return
         
+        if self.browser_session.enabled and self._session_authenticated():
+            return
+        
         username = self.config.get('username')
         password = self.config.get('password')
         
@@ -88,10 +205,15 @@ class WebScraper:
             password_field.send_keys(password)
             login_button.click()
             
-            # Aguardar redirecionamento
-            time.sleep(3)
+            # Aguardar redirecionamento (formulário de login sai da página)
+            WebDriverWait(self.driver, self.config.get('login_wait_seconds', 10)).until(
+                EC.invisibility_of_element_located((By.ID, "username"))
+            )
             self.logger.info("Login realizado com sucesso")
             
+            if self.browser_session.enabled:
+                self.browser_session.save_cookies()
+            
         except Exception as e:
             self.logger.error(f"Erro ao fazer login: {e}")
             raise
@@ -107,6 +229,10 @@ class WebScraper:
         Returns:
             Caminho do arquivo baixado ou None
         """
+        if self.config.get('direct_download', {}).get('enabled', False):
+            return self.download_direct(downloads_dir)
+        
+        failed = False
         try:
             self._setup_driver(downloads_dir)
             
@@ -115,22 +241,28 @@ class WebScraper:
                 raise ValueError("URL não configurada para Fonte 1")
             
             self.logger.info(f"Acessando {url}")
+            start = time.monotonic()
             self.driver.get(url)
             
-            # Aguardar carregamento da página
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Aguardar carregamento da página (no perfil rápido, espera-se direto o controle de download)
+            if not self._fast_profile():
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+            page_load = time.monotonic() - start
             
             # Realizar login se necessário
             self._login()
             
+            # Arquivos já existentes não contam como o novo download
+            existing_files = self._list_downloads()
+            
             # AJUSTAR: Localizar e clicar no botão de download
             # Este é um exemplo genérico - ajustar os seletores conforme o site real
             try:
                 # Exemplo 1: Botão com ID específico
                 download_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Download')]"))
+                    EC.element_to_be_clickable((By.XPATH, self.config.get('download_xpath', DOWNLOAD_BUTTON_XPATH)))
                 )
                 download_button.click()
                 self.logger.info("Botão de download clicado")
@@ -138,16 +270,16 @@ class WebScraper:
             except Exception as e:
                 self.logger.warning(f"Não foi possível localizar botão de download padrão: {e}")
                 # Exemplo 2: Link direto para arquivo
-                download_link = self.driver.find_element(By.XPATH, "//a[contains(@href, '.xlsx') or contains(@href, '.xls')]")
+                download_link = self.driver.find_element(By.XPATH, EXPORT_LINK_XPATH)
                 download_link.click()
             
-            # Aguardar download
-            wait_seconds = self.config.get('download_wait_seconds', 10)
-            self.logger.info(f"Aguardando {wait_seconds}s para conclusão do download")
-            time.sleep(wait_seconds)
+            self.logger.info(
+                f"Tempos: carregamento da página {page_load:.2f}s, "
+                f"até o clique {time.monotonic() - start:.2f}s"
+            )
             
-            # Encontrar arquivo baixado
-            downloaded_file = self._get_latest_download()
+            # Aguardar conclusão do download (limite: download_wait_seconds)
+            downloaded_file = self._wait_for_download(existing_files)
             
             if downloaded_file:
                 self.logger.info(f"Planilha baixada com sucesso: {downloaded_file}")
@@ -158,35 +290,337 @@ class WebScraper:
                 
         except Exception as e:
             self.logger.error(f"Erro ao baixar planilha: {e}")
+            failed = True
             raise
         
         finally:
-            self.close()
+            self._release_driver(failed)
+    
+    def _resolve_export_url(self, downloads_dir: str) -> str:
+        """
+        Usa o navegador (login incluso) apenas para descobrir a URL de exportação
+        
+        Os cookies autenticados são salvos para o download direto.
+        
+        Args:
+            downloads_dir: Diretório de downloads (exigido pelo driver)
+        
+        Returns:
+            URL absoluta da planilha
+        """
+        direct = self.config.get('direct_download', {})
+        failed = False
+        try:
+            self._setup_driver(downloads_dir)
+            
+            url = self.config.get('url')
+            if not url:
+                raise ValueError("URL não configurada para Fonte 1")
+            
+            self.logger.info(f"Resolvendo URL de exportação em {url}")
+            self.driver.get(url)
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            self._login()
+            
+            link = WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, EXPORT_LINK_XPATH))
+            )
+            export_url = link.get_attribute('href')
+            
+            self.browser_session.save_cookies(self.driver)
+            
+            if not direct.get('export_url'):
+                self._write_json(direct.get('url_cache_file', 'temp/fonte1_export_url.json'),
+                                 {'export_url': export_url})
+            
+            self.logger.info(f"URL de exportação: {export_url}")
+            return export_url
+        
+        except Exception as e:
+            self.logger.error(f"Erro ao resolver URL de exportação: {e}")
+            failed = True
+            raise
+        
+        finally:
+            self._release_driver(failed)
+    
+    def _cached_export_url(self) -> Optional[str]:
+        """URL de exportação configurada ou resolvida anteriormente"""
+        direct = self.config.get('direct_download', {})
+        if direct.get('export_url'):
+            return direct['export_url']
+        return self._read_json(direct.get('url_cache_file', 'temp/fonte1_export_url.json')).get('export_url')
+    
+    def _http_session(self) -> requests.Session:
+        """
+        Sessão HTTP reutilizada, carregada com os cookies salvos do navegador
+        
+        Returns:
+            Sessão requests
+        """
+        if self.http is None:
+            self.http = requests.Session()
+            self.http.headers['User-Agent'] = self.config.get(
+                'user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)'
+            )
+        
+        self.http.cookies.clear()
+        for cookie in self.browser_session.load_cookies():
+            self.http.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        return self.http
+    
+    @staticmethod
+    def _read_json(path: str) -> dict:
+        """Lê um JSON auxiliar (vazio se ausente ou inválido)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
     
-    def _get_latest_download(self) -> Optional[str]:
+    @staticmethod
+    def _write_json(path: str, payload: dict):
+        """Grava um JSON auxiliar"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+    
+    @staticmethod
+    def _filename_from_response(response: requests.Response, url: str) -> str:
+        """Nome do arquivo a partir do Content-Disposition ou da URL"""
+        disposition = response.headers.get('Content-Disposition', '')
+        match = re.search(r"filename\*?=(?:UTF-8'')?\"?([^\";]+)", disposition)
+        if match:
+            return os.path.basename(unquote(match.group(1)))
+        return os.path.basename(unquote(urlparse(url).path)) or 'planilha.xlsx'
+    
+    def _stream_download(self, export_url: str, downloads_dir: str) -> str:
         """
-        Obtém o arquivo mais recente no diretório de downloads
+        Baixa a planilha em blocos direto para o disco
+        
+        Retoma um `.part` interrompido com Range/If-Range e, se o arquivo
+        anterior ainda for atual (304 para If-Modified-Since), reaproveita-o.
+        Um `.part` já completo (416) é finalizado; se não bater com o
+        tamanho informado pelo servidor, é descartado e baixado de novo.
+        401/403 indicam sessão expirada, como a página de login em HTML.
+        
+        Args:
+            export_url: URL da planilha
+            downloads_dir: Diretório de destino
         
         Returns:
-            Caminho do arquivo ou None
+            Caminho do arquivo
         """
-        files = [
-            os.path.join(self.downloads_dir, f) 
-            for f in os.listdir(self.downloads_dir)
-            if f.endswith(('.xlsx', '.xls', '.csv'))
-        ]
+        direct = self.config.get('direct_download', {})
+        chunk_size = int(direct.get('chunk_size_kb', 512)) * 1024
+        timeout = direct.get('timeout', 60)
         
-        if not files:
-            return None
+        downloads_dir = os.path.abspath(downloads_dir)
+        os.makedirs(downloads_dir, exist_ok=True)
+        meta_path = os.path.join(downloads_dir, '.fonte1_download.json')
+        meta = self._read_json(meta_path)
+        if meta.get('url') != export_url:
+            meta = {}
         
-        # Arquivo mais recente
-        latest_file = max(files, key=os.path.getctime)
-        return latest_file
+        final_path = meta.get('file')
+        part_path = f"{final_path}.part" if final_path else None
+        validator = meta.get('etag') or meta.get('last_modified')
+        
+        headers = {}
+        resume_from = 0
+        if part_path and os.path.exists(part_path) and validator:
+            resume_from = os.path.getsize(part_path)
+            headers['Range'] = f"bytes={resume_from}-"
+            headers['If-Range'] = validator
+        elif final_path and os.path.exists(final_path) and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        
+        session = self._http_session()
+        start = time.monotonic()
+        
+        with session.get(export_url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code == 304:
+                self.logger.info(f"Planilha não modificada, reutilizando {final_path}")
+                return final_path
+            
+            if response.status_code in (401, 403):
+                raise SessionExpiredError(f"Download recusado (HTTP {response.status_code})")
+            
+            if response.status_code == 416 and resume_from:
+                # Range além do fim: o .part já tem o arquivo inteiro ou está inválido
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                if total.isdigit() and int(total) == resume_from:
+                    os.replace(part_path, final_path)
+                    self.logger.info(f"Download já estava completo em {part_path}, finalizado")
+                    return final_path
+                
+                self.logger.warning(f"Download parcial inválido ({part_path}), baixando novamente")
+                os.remove(part_path)
+                return self._stream_download(export_url, downloads_dir)
+            
+            response.raise_for_status()
+            
+            if 'text/html' in response.headers.get('Content-Type', ''):
+                raise SessionExpiredError("Resposta HTML recebida no lugar da planilha")
+            
+            if response.status_code != 206:
+                resume_from = 0
+                final_path = os.path.join(downloads_dir, self._filename_from_response(response, export_url))
+                part_path = f"{final_path}.part"
+            else:
+                self.logger.info(f"Retomando download a partir de {resume_from} bytes")
+            
+            # Validadores gravados antes do corpo para permitir retomada
+            meta = {
+                'url': export_url,
+                'file': final_path,
+                'etag': response.headers.get('ETag') or meta.get('etag'),
+                'last_modified': response.headers.get('Last-Modified') or meta.get('last_modified')
+            }
+            self._write_json(meta_path, meta)
+            
+            written = resume_from
+            with open(part_path, 'ab' if resume_from else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+        
+        os.replace(part_path, final_path)
+        self.logger.info(
+            f"Download direto concluído: {written / 1024:.1f} KB em {time.monotonic() - start:.1f}s"
+        )
+        return final_path
+    
+    def download_direct(self, downloads_dir: str) -> Optional[str]:
+        """
+        Baixa a planilha via HTTP sem abrir o navegador no caminho principal
+        
+        O navegador só é usado para resolver a URL de exportação e/ou
+        autenticar quando não há URL conhecida, cookies válidos ou quando
+        o portal devolve a página de login.
+        
+        Args:
+            downloads_dir: Diretório para salvar o download
+        
+        Returns:
+            Caminho do arquivo baixado
+        """
+        export_url = self._cached_export_url()
+        needs_login = self.config.get('login_required', False) and not self.browser_session.load_cookies()
+        
+        if export_url is None or needs_login:
+            export_url = self._resolve_export_url(downloads_dir)
+        
+        try:
+            return self._stream_download(export_url, downloads_dir)
+        except SessionExpiredError as e:
+            self.logger.warning(f"{e}; renovando sessão pelo navegador")
+            self.browser_session.clear_cookies()
+            export_url = self._resolve_export_url(downloads_dir)
+            return self._stream_download(export_url, downloads_dir)
+    
+    def _list_downloads(self) -> Set[str]:
+        """
+        Lista os arquivos presentes no diretório de downloads
+        
+        Returns:
+            Conjunto de nomes de arquivo
+        """
+        return set(os.listdir(self.downloads_dir))
+    
+    def _wait_for_download(self, existing_files: Set[str]) -> Optional[str]:
+        """
+        Aguarda um novo arquivo aparecer, perder o sufixo parcial e parar de crescer
+        
+        O diretório é consultado a cada `download_poll_seconds`; o arquivo é
+        considerado completo quando seu tamanho se mantém por
+        `download_stable_checks` leituras consecutivas e não há parcial pendente.
+        
+        Args:
+            existing_files: Arquivos presentes antes do clique
+        
+        Returns:
+            Caminho do arquivo baixado ou None se o tempo limite esgotar
+        """
+        timeout = self.config.get('download_wait_seconds', 10)
+        poll = self.config.get('download_poll_seconds', 0.25)
+        stable_checks = self.config.get('download_stable_checks', 2)
+        
+        self.logger.info(f"Aguardando conclusão do download (limite {timeout}s)")
+        
+        start = time.monotonic()
+        deadline = start + timeout
+        candidate = None
+        last_size = -1
+        stable = 0
+        
+        while time.monotonic() < deadline:
+            new_files = self._list_downloads() - existing_files
+            partial = [f for f in new_files if f.endswith(PARTIAL_SUFFIXES)]
+            complete = [f for f in new_files if f.endswith(DOWNLOAD_EXTENSIONS)]
+            
+            if complete and not partial:
+                path = max(
+                    (os.path.join(self.downloads_dir, f) for f in complete),
+                    key=os.path.getmtime
+                )
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    size = -1
+                
+                if path == candidate and size == last_size and size > 0:
+                    stable += 1
+                else:
+                    candidate, last_size, stable = path, size, 0
+                
+                if stable >= stable_checks:
+                    self.logger.info(f"Download concluído em {time.monotonic() - start:.1f}s")
+                    return candidate
+            
+            time.sleep(poll)
+        
+        self.logger.warning(f"Tempo limite de {timeout}s esgotado aguardando o download")
+        return None
+    
+    def _release_driver(self, failed: bool = False):
+        """
+        Libera o driver ao fim de uma execução
+        
+        Com sessão persistente o navegador continua aberto, exceto após falha.
+        
+        Args:
+            failed: Se a execução terminou com erro
+        """
+        if self.browser_session.enabled:
+            self.browser_session.release(failed)
+            self.driver = None
+        else:
+            self.close()
     
     def close(self):
-        """Fecha o driver"""
+        """Fecha o driver (inclusive o navegador mantido pela sessão persistente)"""
+        if self.http is not None:
+            self.http.close()
+            self.http = None
+        
+        if self.browser_session.enabled:
+            if self.browser_session.driver is not None:
+                self.browser_session.recycle()
+                self.logger.info("Driver Selenium fechado")
+            self.driver = None
+            return
+        
         if self.driver:
             self.driver.quit()
+            self.driver = None
             self.logger.info("Driver Selenium fechado")
 
 
@@ -201,8 +635,10 @@ if __name__ == "__main__":
     
     logger = setup_logger('web_scraper_test', config['logging'])
     
-    scraper = WebScraper(config['fonte1'], logger)
+    from src.utils.driver_provider import DriverProvider
+    scraper = WebScraper(config['fonte1'], logger, DriverProvider(config.get('browser', {}), logger))
     file_path = scraper.download_spreadsheet(config['paths']['downloads_dir'])
+    scraper.close()
     
     if file_path:
         logger.info(f"✓ Teste concluído. Arquivo: {file_path}")
@@ -0,0 +1,6 @@
+"""Inicializador do pacote pipeline"""
+from .dag import DAGRunner, Task
+from .runner import PipelineRunner
+from .scheduler import PipelineScheduler
+
+__all__ = ['DAGRunner', 'Task', 'PipelineRunner', 'PipelineScheduler']
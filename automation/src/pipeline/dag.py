@@ -0,0 +1,183 @@
+"""
+Execução de etapas em grafo de dependências (DAG) com paralelismo
+"""
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class Task:
+    """Etapa do pipeline: função que recebe os resultados das dependências"""
+    
+    def __init__(self, name: str, func: Callable[..., Any], deps: Sequence[str] = (),
+                 enabled: bool = True):
+        """
+        Define a etapa
+        
+        Args:
+            name: Nome único da etapa
+            func: Função chamada com os resultados das dependências, na ordem de `deps`
+            deps: Nomes das etapas das quais depende
+            enabled: Etapas desativadas não executam e produzem None
+        """
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.enabled = enabled
+
+
+class DAGRunner:
+    """Executa as etapas assim que as dependências terminam, em um pool de threads"""
+    
+    def __init__(self, max_workers: int, logger: logging.Logger):
+        """
+        Inicializa o executor
+        
+        Args:
+            max_workers: Máximo de etapas simultâneas
+            logger: Logger configurado
+        """
+        self.max_workers = max(1, max_workers)
+        self.logger = logger
+        self.timings: Dict[str, Dict[str, float]] = {}
+    
+    @staticmethod
+    def _validate(tasks: Dict[str, Task]):
+        """Verifica dependências inexistentes e ciclos"""
+        for task in tasks.values():
+            for dep in task.deps:
+                if dep not in tasks:
+                    raise ValueError(f"Etapa '{task.name}' depende de etapa inexistente '{dep}'")
+        
+        visiting, done = set(), set()
+        
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Ciclo de dependências envolvendo '{name}'")
+            visiting.add(name)
+            for dep in tasks[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in tasks:
+            visit(name)
+    
+    def run(self, task_list: List[Task]) -> Dict[str, Any]:
+        """
+        Executa o grafo
+        
+        Uma falha interrompe o agendamento de novas etapas; as que já estão
+        em execução terminam e a exceção é propagada.
+        
+        Args:
+            task_list: Etapas do pipeline
+        
+        Returns:
+            Resultado de cada etapa, por nome
+        """
+        tasks = {task.name: task for task in task_list}
+        self._validate(tasks)
+        
+        results: Dict[str, Any] = {}
+        self.timings = {}
+        pending = dict(tasks)
+        running = {}
+        origin = time.monotonic()
+        error: Optional[BaseException] = None
+        
+        def execute(task: Task) -> Any:
+            start = time.monotonic()
+            try:
+                return task.func(*[results[dep] for dep in task.deps])
+            finally:
+                self.timings[task.name] = {'start': start - origin, 'end': time.monotonic() - origin}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pipeline') as pool:
+            while pending or running:
+                if error is None:
+                    ready = [task for task in pending.values() if all(dep in results for dep in task.deps)]
+                    for task in ready:
+                        del pending[task.name]
+                        if not task.enabled:
+                            self.logger.info(f"Etapa '{task.name}' desativada")
+                            results[task.name] = None
+                            now = time.monotonic() - origin
+                            self.timings[task.name] = {'start': now, 'end': now}
+                            continue
+                        self.logger.info(f"▶ Etapa '{task.name}' iniciada")
+                        running[pool.submit(execute, task)] = task
+                    if ready and not running:
+                        # Só etapas desativadas ficaram prontas: reavaliar dependentes
+                        continue
+                
+                if not running:
+                    break
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task = running.pop(future)
+                    elapsed = self.timings[task.name]['end'] - self.timings[task.name]['start']
+                    try:
+                        results[task.name] = future.result()
+                        self.logger.info(f"✓ Etapa '{task.name}' concluída em {elapsed:.2f}s")
+                    except Exception as e:
+                        self.logger.error(f"Etapa '{task.name}' falhou após {elapsed:.2f}s: {e}")
+                        if error is None:
+                            error = e
+        
+        if error is not None:
+            raise error
+        
+        self._log_critical_path(tasks)
+        return results
+    
+    def critical_path(self, tasks: Dict[str, Task]) -> List[str]:
+        """
+        Caminho crítico da última execução
+        
+        Parte da etapa que terminou por último e segue, a cada passo, a
+        dependência que terminou mais tarde (a que de fato a segurou).
+        Etapas desativadas não entram: o caminho passa pelas dependências delas.
+        
+        Args:
+            tasks: Etapas por nome
+        
+        Returns:
+            Nomes das etapas, da primeira para a última
+        """
+        executed = [name for name in self.timings if tasks[name].enabled]
+        if not executed:
+            return []
+        
+        def enabled_deps(name: str) -> List[str]:
+            deps = []
+            for dep in tasks[name].deps:
+                deps.extend([dep] if tasks[dep].enabled else enabled_deps(dep))
+            return deps
+        
+        current = max(executed, key=lambda name: self.timings[name]['end'])
+        path = [current]
+        deps = enabled_deps(current)
+        while deps:
+            current = max(deps, key=lambda name: self.timings[name]['end'])
+            path.append(current)
+            deps = enabled_deps(current)
+        return list(reversed(path))
+    
+    def _log_critical_path(self, tasks: Dict[str, Task]):
+        """Registra o caminho crítico e o tempo economizado pelo paralelismo"""
+        path = self.critical_path(tasks)
+        if not path:
+            return
+        
+        durations = {name: t['end'] - t['start'] for name, t in self.timings.items() if tasks[name].enabled}
+        wall = max(self.timings[name]['end'] for name in durations)
+        serial = sum(durations.values())
+        
+        steps = ' → '.join(f"{name} ({durations[name]:.2f}s)" for name in path)
+        self.logger.info(f"Caminho crítico: {steps}")
+        self.logger.info(f"✓ Tempo total {wall:.2f}s (sequencial seria {serial:.2f}s)")
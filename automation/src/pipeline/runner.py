@@ -0,0 +1,219 @@
+"""
+Pipeline completo - coleta, processamento, visualização e envio
+"""
+import os
+import time
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+import pandas as pd
+
+from ..collectors import WebScraper, APIClient
+from ..processors import DataProcessor
+from ..visualizers import HTMLGenerator
+from ..capture import ScreenshotMaker
+from ..messaging import WhatsAppSender
+from ..utils.driver_provider import DriverProvider
+from .dag import DAGRunner, Task
+
+
+class PipelineRunner:
+    """Liga coletores, processador, gerador HTML, screenshot e WhatsApp em um grafo de etapas"""
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa os componentes do pipeline
+        
+        Args:
+            config: Configuração completa (config.yaml)
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.pipeline_config = config.get('pipeline', {})
+        self.paths = config.get('paths', {})
+        
+        self.fonte1_enabled = config.get('fonte1', {}).get('enabled', True)
+        self.fonte2_enabled = config.get('fonte2', {}).get('enabled', True)
+        
+        # ChromeDriver resolvido uma vez para scraper e screenshot
+        self.driver_provider = DriverProvider(config.get('browser', {}), logger)
+        
+        self.scraper = WebScraper(config['fonte1'], logger, self.driver_provider) if self.fonte1_enabled else None
+        self.api_client = APIClient(config['fonte2'], logger) if self.fonte2_enabled else None
+        self.processor = DataProcessor(config.get('processing', {}), logger)
+        self.html_generator = HTMLGenerator(config.get('visualization', {}), logger)
+        self.screenshot_maker = ScreenshotMaker(config.get('screenshot', {}), logger, self.driver_provider)
+        self.sender = WhatsAppSender(config['whatsapp'], logger) if self.pipeline_config.get('send_whatsapp', True) else None
+        
+        self.change_detection = config.get('processing', {}).get('change_detection', {}).get('enabled', False)
+        self.chunked = config.get('processing', {}).get('chunked', {}).get('enabled', False)
+        
+        if self.fonte2_enabled:
+            self._check_incremental_key()
+    
+    def _check_incremental_key(self):
+        """Avisa se a chave do snapshot incremental não está no mapeamento de colunas da Fonte 2"""
+        incremental = self.config['fonte2'].get('incremental', {})
+        key_field = incremental.get('key_field')
+        if not incremental.get('enabled', False) or not key_field:
+            return
+        
+        mapping = self.config.get('processing', {}).get('column_mapping', {}).get('fonte2', {})
+        if key_field not in mapping:
+            self.logger.warning(
+                f"fonte2.incremental.key_field '{key_field}' não está em processing.column_mapping.fonte2; "
+                "registros sem esse campo são acrescentados ao snapshot sem deduplicação"
+            )
+    
+    def _collect_fonte1(self) -> str:
+        """Baixa a planilha da Fonte 1"""
+        file_path = self.scraper.download_spreadsheet(self.paths.get('downloads_dir', 'downloads'))
+        if not file_path:
+            raise RuntimeError("Download da Fonte 1 não retornou arquivo")
+        return file_path
+    
+    def _collect_fonte2(self) -> Iterable:
+        """
+        Busca os registros da Fonte 2
+        
+        Em modo de blocos (sem sincronização incremental, que precisa do
+        snapshot inteiro), devolve o iterador de páginas: a busca acontece
+        enquanto a unificação consome os blocos.
+        """
+        if self.chunked and not self.config['fonte2'].get('incremental', {}).get('enabled', False):
+            return self.api_client.iter_pages()
+        return self.api_client.fetch_data()
+    
+    def _normalize_fonte1(self, file_path: str) -> pd.DataFrame:
+        """Carrega e normaliza a Fonte 1"""
+        return self.processor.prepare_source(self.processor.load_excel_data(file_path, 'fonte1'), 'fonte1')
+    
+    def _normalize_fonte2(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Converte e normaliza a Fonte 2"""
+        return self.processor.prepare_source(self.processor.process_api_data(records), 'fonte2')
+    
+    def _merge(self, df1: Optional[pd.DataFrame], df2: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Unifica as fontes (fontes desativadas entram vazias)"""
+        if df1 is None and df2 is None:
+            raise RuntimeError("Nenhuma fonte habilitada (fonte1.enabled / fonte2.enabled)")
+        return self.processor.finalize(
+            df1 if df1 is not None else pd.DataFrame(),
+            df2 if df2 is not None else pd.DataFrame()
+        )
+    
+    def _merge_chunked(self, file_path: Optional[str], pages: Optional[Iterable]) -> pd.DataFrame:
+        """Normaliza e unifica as fontes em blocos (`processing.chunked.enabled`)"""
+        if file_path is None and pages is None:
+            raise RuntimeError("Nenhuma fonte habilitada (fonte1.enabled / fonte2.enabled)")
+        return self.processor.process_chunked_frame(file_path, pages)
+    
+    def _detect_changes(self, df: pd.DataFrame) -> Optional[Dict[str, pd.DataFrame]]:
+        """Compara com a execução anterior (se change_detection estiver ativo)"""
+        return self.processor.detect_changes(df) if self.change_detection else None
+    
+    def _render(self, df: pd.DataFrame, changes: Optional[Dict[str, pd.DataFrame]]) -> Optional[str]:
+        """Gera o HTML, exceto quando nada mudou e `skip_unchanged` está ativo"""
+        if changes is not None and self.pipeline_config.get('skip_unchanged', False):
+            if not any(len(changes[kind]) for kind in ('added', 'changed', 'removed')):
+                self.logger.info("Nenhuma mudança desde a última execução, relatório não gerado")
+                return None
+        
+        output_dir = self.paths.get('output_dir', 'output')
+        report_file = self.pipeline_config.get('report_file', os.path.join(output_dir, 'relatorio.html'))
+        return self.html_generator.generate_html_table(df, report_file)
+    
+    def _capture(self, html_path: Optional[str]) -> Optional[str]:
+        """Captura o screenshot do relatório"""
+        if html_path is None:
+            return None
+        return self.screenshot_maker.capture_html_table(html_path)
+    
+    def _send(self, image_path: Optional[str]) -> bool:
+        """Envia o screenshot via WhatsApp"""
+        if image_path is None or self.sender is None:
+            return False
+        return self.sender.send_image(image_path)
+    
+    def build_tasks(self) -> List[Task]:
+        """
+        Monta o grafo de etapas
+        
+        As coletas das duas fontes rodam em paralelo, assim como a
+        normalização de cada fonte; a unificação espera ambas. Em modo
+        de blocos, normalização e unificação são uma única etapa.
+        
+        Returns:
+            Lista de etapas
+        """
+        if self.chunked:
+            processing = [
+                Task('unificacao', self._merge_chunked, ['coleta_fonte1', 'coleta_fonte2'])
+            ]
+        else:
+            processing = [
+                Task('normaliza_fonte1', self._normalize_fonte1, ['coleta_fonte1'], enabled=self.fonte1_enabled),
+                Task('normaliza_fonte2', self._normalize_fonte2, ['coleta_fonte2'], enabled=self.fonte2_enabled),
+                Task('unificacao', self._merge, ['normaliza_fonte1', 'normaliza_fonte2'])
+            ]
+        
+        return [
+            Task('coleta_fonte1', self._collect_fonte1, enabled=self.fonte1_enabled),
+            Task('coleta_fonte2', self._collect_fonte2, enabled=self.fonte2_enabled),
+            *processing,
+            Task('mudancas', self._detect_changes, ['unificacao']),
+            Task('html', self._render, ['unificacao', 'mudancas']),
+            Task('screenshot', self._capture, ['html']),
+            Task('envio', self._send, ['screenshot'], enabled=self.sender is not None)
+        ]
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Executa o pipeline completo
+        
+        O estado da detecção de mudanças só é gravado se todas as etapas
+        concluírem; remoções só são gravadas se a busca da Fonte 2 foi
+        completa (mesma regra do watermark incremental).
+        
+        Returns:
+            Resultado de cada etapa, por nome
+        """
+        self.logger.info("=== Iniciando pipeline completo ===")
+        start = time.monotonic()
+        
+        runner = DAGRunner(int(self.pipeline_config.get('max_workers', 4)), self.logger)
+        results = runner.run(self.build_tasks())
+        
+        if results.get('mudancas') is not None:
+            complete = self.api_client is None or self.api_client.last_fetch_ok
+            if not complete:
+                self.logger.warning("Busca da Fonte 2 incompleta: linhas ausentes não gravadas como removidas")
+            self.processor.commit_changes(results['unificacao'], results['mudancas'], removals=complete)
+        
+        self.logger.info(f"=== Pipeline completo concluído em {time.monotonic() - start:.1f}s ===")
+        return results
+    
+    def close(self):
+        """Libera navegador e sessões HTTP"""
+        if self.scraper is not None:
+            self.scraper.close()
+        if self.api_client is not None:
+            self.api_client.close()
+        self.screenshot_maker.close()
+
+
+# Para testes
+if __name__ == "__main__":
+    import yaml
+    from src.utils.logger import setup_logger
+    
+    # Carregar config
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    logger = setup_logger('pipeline', config['logging'])
+    
+    pipeline = PipelineRunner(config, logger)
+    try:
+        pipeline.run()
+    finally:
+        pipeline.close()
@@ -0,0 +1,163 @@
+"""
+Agendador - mantém o pipeline residente e o executa no horário configurado
+"""
+import time
+import signal
+import logging
+import threading
+from typing import Optional
+import schedule
+
+from .runner import PipelineRunner
+
+
+class PipelineScheduler:
+    """Executa o PipelineRunner periodicamente em um único processo"""
+    
+    def __init__(self, config: dict, logger: logging.Logger, runner: Optional[PipelineRunner] = None):
+        """
+        Inicializa o agendador
+        
+        O PipelineRunner é criado uma vez e reutilizado entre execuções:
+        módulos importados, sessões HTTP, ambiente Jinja e, com
+        `fonte1.session.enabled` / `screenshot.keep_driver`, o navegador
+        continuam abertos.
+        
+        Args:
+            config: Configuração completa (config.yaml)
+            logger: Logger configurado
+            runner: Pipeline já construído (cria um se None)
+        """
+        self.config = config
+        self.logger = logger
+        self.scheduler_config = config.get('scheduler', {})
+        self.overlap = self.scheduler_config.get('overlap', 'skip')
+        
+        if self.overlap not in ('skip', 'coalesce'):
+            raise ValueError(f"Política de sobreposição não suportada: {self.overlap}")
+        
+        self.runner = runner or PipelineRunner(config, logger)
+        self.scheduler = schedule.Scheduler()
+        
+        self._state_lock = threading.Lock()
+        self._running = False
+        self._pending = False
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+    
+    def _configure_jobs(self):
+        """Registra as execuções: `schedule_times` (diário) ou `interval_minutes`"""
+        times = self.scheduler_config.get('schedule_times') or []
+        if times:
+            for at in times:
+                self.scheduler.every().day.at(at).do(self.trigger)
+            self.logger.info(f"Agendado diariamente às {', '.join(times)}")
+        else:
+            interval = int(self.scheduler_config.get('interval_minutes', 60))
+            self.scheduler.every(interval).minutes.do(self.trigger)
+            self.logger.info(f"Agendado a cada {interval} minutos")
+    
+    def trigger(self):
+        """
+        Dispara uma execução em segundo plano
+        
+        Se a anterior ainda estiver rodando, o disparo é ignorado (`skip`)
+        ou agrupado em uma única execução logo após o término (`coalesce`).
+        """
+        with self._state_lock:
+            if self._running:
+                self.skipped += 1
+                if self.overlap == 'coalesce':
+                    self._pending = True
+                    self.logger.warning("Execução anterior em andamento, nova execução enfileirada")
+                else:
+                    self.logger.warning("Execução anterior em andamento, disparo ignorado")
+                return
+            self._running = True
+        
+        self._worker = threading.Thread(target=self._work, name='pipeline', daemon=True)
+        self._worker.start()
+    
+    def _work(self):
+        """Executa o pipeline até não haver disparo agrupado pendente"""
+        while True:
+            self._run_once()
+            with self._state_lock:
+                if not self._pending or self._stop.is_set():
+                    self._pending = False
+                    self._running = False
+                    return
+                self._pending = False
+    
+    def _run_once(self):
+        """Uma execução do pipeline, com duração registrada; falhas não param o agendador"""
+        self.runs += 1
+        number = self.runs
+        start = time.monotonic()
+        
+        try:
+            self.runner.run()
+        except Exception as e:
+            self.failures += 1
+            self.logger.error(f"Execução #{number} falhou após {time.monotonic() - start:.1f}s: {e}")
+            return
+        
+        self.logger.info(f"✓ Execução #{number} concluída em {time.monotonic() - start:.1f}s")
+    
+    def stop(self, *_):
+        """Pede o encerramento (também usado como handler de SIGINT/SIGTERM)"""
+        self.logger.info("Encerramento solicitado, aguardando execução em andamento")
+        self._stop.set()
+    
+    def serve(self):
+        """
+        Laço principal: dispara as execuções agendadas até `stop`
+        
+        Ao sair, aguarda a execução em andamento e libera os recursos do pipeline.
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+        
+        self._configure_jobs()
+        if self.scheduler_config.get('run_on_start', True):
+            self.trigger()
+        
+        try:
+            while not self._stop.is_set():
+                self.scheduler.run_pending()
+                self._stop.wait(1)
+        finally:
+            if self._worker is not None:
+                self._worker.join()
+            self.runner.close()
+            self.logger.info(
+                f"✓ Agendador encerrado: {self.runs} execuções, {self.failures} falhas, "
+                f"{self.skipped} disparos sobrepostos"
+            )
+
+
+# Para testes
+if __name__ == "__main__":
+    import yaml
+    from src.utils.logger import setup_logger
+    
+    # Carregar config
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    logger = setup_logger('scheduler', config['logging'])
+    
+    if config.get('scheduler', {}).get('enabled', False):
+        PipelineScheduler(config, logger).serve()
+    else:
+        # Agendador desativado: uma execução única
+        pipeline = PipelineRunner(config, logger)
+        try:
+            pipeline.run()
+        finally:
+            pipeline.close()
@@ -1,4 +1,8 @@
 """Inicializador do pacote processors"""
 from .data_processor import DataProcessor
+from .frame_cache import FrameCache
+from .key_index import KeyIndex
+from .change_tracker import ChangeTracker
+from .polars_backend import PolarsBackend
 
-__all__ = ['DataProcessor']
+__all__ = ['DataProcessor', 'FrameCache', 'KeyIndex', 'ChangeTracker', 'PolarsBackend']
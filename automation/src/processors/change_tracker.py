@@ -0,0 +1,168 @@
+"""
+Detecção de mudanças por linha - impressões digitais persistidas em SQLite
+"""
+import os
+import json
+import sqlite3
+import logging
+from datetime import datetime
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from .key_index import KeyIndex
+
+
+class ChangeTracker:
+    """Compara cada linha com a impressão digital da execução anterior, pela chave de negócio"""
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa o rastreador
+        
+        Args:
+            config: Configuração `processing.change_detection`
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.store_path = config.get('store', 'temp/fingerprints.sqlite')
+        self.ignore_columns = list(config.get('ignore_columns', []))
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Abre o banco, criando a tabela se necessário"""
+        directory = os.path.dirname(self.store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        conn = sqlite3.connect(self.store_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "key_hash INTEGER PRIMARY KEY, key TEXT NOT NULL, "
+            "fingerprint INTEGER NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        return conn
+    
+    def fingerprint(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Hash vetorizado do conteúdo de cada linha
+        
+        As colunas entram em ordem alfabética, para que reordenações não
+        sejam vistas como mudança, e com os tipos normalizados de
+        KeyIndex.hash_rows (ex.: volume int8 ou float64 dá o mesmo hash).
+        
+        Args:
+            df: DataFrame normalizado
+        
+        Returns:
+            Array int64, um hash por linha
+        """
+        columns = sorted((col for col in df.columns if col not in self.ignore_columns), key=str)
+        return KeyIndex.hash_rows(df, columns).view(np.int64)
+    
+    def detect(self, df: pd.DataFrame, key: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Separa as linhas novas, alteradas e removidas desde a última gravação
+        
+        Linhas com chave nula são ignoradas; com chave repetida, vale a primeira.
+        
+        Args:
+            df: DataFrame normalizado
+            key: Colunas da chave de negócio
+        
+        Returns:
+            Dicionário com 'added' e 'changed' (linhas de `df`), 'removed'
+            (colunas da chave) e os hashes usados por `commit`
+        """
+        positions = np.flatnonzero(df[key].notna().all(axis=1).to_numpy())
+        current = df.iloc[positions]
+        
+        key_hashes = KeyIndex.hash_rows(current, key).view(np.int64)
+        unique = ~pd.Series(key_hashes).duplicated(keep='first').to_numpy()
+        if not unique.all():
+            self.logger.warning(f"{int((~unique).sum())} linhas com chave repetida ignoradas na detecção de mudanças")
+            current, key_hashes, positions = current[unique], key_hashes[unique], positions[unique]
+        
+        fingerprints = self.fingerprint(current)
+        
+        conn = self._connect()
+        try:
+            stored = pd.read_sql_query("SELECT key_hash, key, fingerprint FROM fingerprints", conn)
+        finally:
+            conn.close()
+        
+        stored_index = pd.Index(stored['key_hash'].to_numpy())
+        position = stored_index.get_indexer(key_hashes)
+        is_new = position < 0
+        previous = np.append(stored['fingerprint'].to_numpy(dtype=np.int64), 0)[position]
+        is_changed = ~is_new & (previous != fingerprints)
+        
+        gone = ~stored_index.isin(key_hashes)
+        removed = pd.DataFrame(
+            [json.loads(value) for value in stored['key'][gone]],
+            columns=key
+        ) if gone.any() else pd.DataFrame(columns=key)
+        
+        changes = {
+            'added': current[is_new],
+            'changed': current[is_changed],
+            'removed': removed,
+            'fingerprints': pd.DataFrame({
+                'key_hash': key_hashes,
+                'fingerprint': fingerprints,
+                'position': positions,
+                'pending': is_new | is_changed
+            }),
+            'removed_hashes': pd.DataFrame({'key_hash': stored_index[gone]})
+        }
+        
+        self.logger.info(
+            f"✓ Mudanças detectadas: {int(is_new.sum())} novas, {int(is_changed.sum())} alteradas, "
+            f"{len(removed)} removidas, {int((~is_new & ~is_changed).sum())} inalteradas"
+        )
+        return changes
+    
+    def commit(self, df: pd.DataFrame, key: List[str], changes: Dict[str, pd.DataFrame],
+               removals: bool = True):
+        """
+        Grava as impressões digitais das linhas novas/alteradas e apaga as removidas
+        
+        Deve ser chamado só depois que as etapas seguintes concluírem, para que
+        uma execução com falha reprocesse as mesmas mudanças.
+        
+        Args:
+            df: DataFrame passado a `detect`
+            key: Colunas da chave de negócio
+            changes: Resultado de `detect`
+            removals: Se as chaves ausentes devem ser apagadas (False após coleta incompleta)
+        """
+        pending = changes['fingerprints'][changes['fingerprints']['pending']]
+        removed = changes['removed_hashes']['key_hash'] if removals else []
+        now = datetime.now().isoformat(timespec='seconds')
+        
+        keys = df[key].iloc[pending['position'].to_numpy()].astype(object)
+        rows = zip(
+            pending['key_hash'].tolist(),
+            (json.dumps(values, ensure_ascii=False, default=str) for values in keys.values.tolist()),
+            pending['fingerprint'].tolist(),
+            [now] * len(pending)
+        )
+        
+        conn = self._connect()
+        try:
+            # Uma transação: ou todas as mudanças são gravadas ou nenhuma
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)", rows)
+                conn.executemany(
+                    "DELETE FROM fingerprints WHERE key_hash = ?",
+                    ((int(value),) for value in removed)
+                )
+        finally:
+            conn.close()
+        
+        self.logger.info(f"✓ Impressões digitais gravadas: {len(pending)} atualizadas, "
+                         f"{len(removed)} removidas")
+    
+    def reset(self):
+        """Apaga o banco de impressões digitais (próxima execução trata tudo como novo)"""
+        if os.path.exists(self.store_path):
+            os.remove(self.store_path)
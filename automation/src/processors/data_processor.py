@@ -1,11 +1,40 @@
 """
 Processador de Dados - Normalização e Unificação
 """
+import os
+import csv
+import glob
 import logging
-from typing import Dict, List, Any, Optional
+import itertools
+import warnings
+import importlib.util
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 import pytz
 from datetime import datetime
+from .frame_cache import FrameCache
+from .key_index import KeyIndex
+from .change_tracker import ChangeTracker
+from .polars_backend import HAS_POLARS, PolarsBackend
+
+
+# Leitor rápido de Excel (pandas >= 2.2 com python-calamine instalado)
+HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+# Leitor de CSV multithread do Arrow (opcional)
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Formatos testados quando a coluna não tem formato declarado em `date_formats`
+DEFAULT_DATE_INPUT_FORMATS = [
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    'ISO8601'
+]
 
 
 class DataProcessor:
@@ -22,25 +51,109 @@ class DataProcessor:
         self.config = config
         self.logger = logger
         self.timezone = pytz.timezone(config.get('timezone', 'America/Sao_Paulo'))
+        self.frame_cache = FrameCache(config.get('frame_cache', {}), logger)
+        self.change_tracker = ChangeTracker(config.get('change_detection', {}), logger)
+        
+        # Formatos de data inferidos por (fonte, coluna) (reaproveitados entre execuções)
+        self._date_formats: Dict[Tuple[Optional[str], str], Optional[str]] = {}
+        
+        # Backend de execução de prepare_source/finalize (pandas = referência)
+        self.backend = None
+        backend = config.get('backend', 'pandas')
+        if backend == 'polars':
+            if HAS_POLARS:
+                self.backend = PolarsBackend(config, logger, self)
+            else:
+                self.logger.warning("polars não instalado, usando backend pandas")
+        elif backend != 'pandas':
+            raise ValueError(f"Backend de processamento não suportado: {backend}")
+    
+    def _source_columns(self, source: str) -> Optional[set]:
+        """
+        Colunas da origem realmente usadas no pipeline
+        
+        Inclui as chaves (nomes originais) e destinos do mapeamento da
+        origem em `column_mapping`, mais as extras de `load_columns`.
+        
+        Args:
+            source: 'fonte1' ou 'fonte2'
+        
+        Returns:
+            Conjunto de nomes ou None para carregar todas
+        """
+        mapping = self.config.get('column_mapping', {}).get(source, {})
+        if not mapping:
+            self.logger.info(f"Sem column_mapping para {source}, carregando todas as colunas")
+            return None
+        
+        wanted = set(mapping) | set(mapping.values())
+        wanted |= set(self.config.get('load_columns', {}).get(source, []))
+        self.logger.debug(f"Colunas carregadas de {source}: {', '.join(sorted(map(str, wanted)))}")
+        return wanted
     
-    def load_excel_data(self, file_path: str) -> pd.DataFrame:
+    def _excel_engine(self, file_path: str) -> str:
+        """
+        Escolhe o leitor de Excel
+        
+        `excel_engine: auto` usa calamine quando instalado; senão openpyxl
+        (que o pandas abre em modo read_only) para .xlsx e xlrd para .xls.
+        
+        Args:
+            file_path: Caminho do arquivo
+        
+        Returns:
+            Nome do engine do pandas
+        """
+        engine = self.config.get('excel_engine', 'auto')
+        if engine != 'auto':
+            return engine
+        if HAS_CALAMINE:
+            return 'calamine'
+        return 'xlrd' if file_path.lower().endswith('.xls') else 'openpyxl'
+    
+    def load_excel_data(self, file_path: str, source: str = 'fonte1') -> pd.DataFrame:
         """
         Carrega dados de planilha Excel/CSV
         
+        Lê apenas as colunas usadas pelo pipeline e aplica os tipos declarados
+        em `column_dtypes` (por nome de coluna original). Com `frame_cache`
+        ativo, um arquivo já lido com as mesmas configurações é carregado do
+        cache em Parquet/Feather em vez de ser interpretado novamente.
+        
         Args:
             file_path: Caminho do arquivo
+            source: Origem, para selecionar mapeamento e tipos
         
         Returns:
             DataFrame com os dados
         """
         self.logger.info(f"Carregando planilha: {file_path}")
         
+        wanted = self._source_columns(source)
+        usecols: Optional[Callable[[str], bool]] = (lambda col: col in wanted) if wanted else None
+        dtypes = self.config.get('column_dtypes', {}).get(source) or None
+        
         try:
-            # Detectar tipo de arquivo
-            if file_path.endswith('.csv'):
-                df = pd.read_csv(file_path, encoding='utf-8-sig')
-            else:
-                df = pd.read_excel(file_path, engine='openpyxl')
+            cache_key = None
+            if self.frame_cache.enabled:
+                cache_key = self.frame_cache.key(file_path, {
+                    'columns': sorted(wanted) if wanted else None,
+                    'dtypes': dtypes,
+                    'reader': self._reader_name(file_path)
+                })
+                df = self.frame_cache.get(cache_key)
+                if df is not None:
+                    self.logger.info(f"✓ Planilha carregada do cache: {len(df)} linhas, {len(df.columns)} colunas")
+                    return df
+            
+            df = self._read_file(file_path, usecols, dtypes)
+            
+            if usecols is not None and len(df.columns) == 0:
+                self.logger.warning("Nenhuma coluna mapeada encontrada na planilha, carregando todas")
+                df = self._read_file(file_path, None, dtypes)
+            
+            if cache_key is not None:
+                self.frame_cache.put(cache_key, df)
             
             self.logger.info(f"✓ Planilha carregada: {len(df)} linhas, {len(df.columns)} colunas")
             return df
@@ -49,6 +162,89 @@ class DataProcessor:
             self.logger.error(f"Erro ao carregar planilha: {e}")
             raise
     
+    def _reader_name(self, file_path: str) -> str:
+        """
+        Leitor usado para o arquivo (parte da chave do cache)
+        
+        Args:
+            file_path: Caminho do arquivo
+        
+        Returns:
+            'csv:<engine>' ou o engine de Excel
+        """
+        if file_path.endswith('.csv'):
+            engine = self.config.get('csv_engine', 'pandas')
+            return f"csv:{engine if engine != 'pyarrow' or HAS_PYARROW else 'pandas'}"
+        return self._excel_engine(file_path)
+    
+    def _read_file(self, file_path: str, usecols: Optional[Callable[[str], bool]],
+                   dtypes: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """
+        Lê o arquivo com o leitor adequado
+        
+        Args:
+            file_path: Caminho do arquivo
+            usecols: Filtro de colunas (None = todas)
+            dtypes: Tipos por coluna
+        
+        Returns:
+            DataFrame lido
+        """
+        # Detectar tipo de arquivo
+        if file_path.endswith('.csv'):
+            if self.config.get('csv_engine', 'pandas') == 'pyarrow':
+                if HAS_PYARROW:
+                    return self._read_csv_arrow(file_path, usecols, dtypes)
+                self.logger.warning("pyarrow não instalado, usando leitor CSV do pandas")
+            return pd.read_csv(file_path, encoding='utf-8-sig', usecols=usecols, dtype=dtypes)
+        
+        engine = self._excel_engine(file_path)
+        self.logger.debug(f"Leitor de Excel: {engine}")
+        return pd.read_excel(file_path, engine=engine, usecols=usecols, dtype=dtypes)
+    
+    def _read_csv_arrow(self, file_path: str, usecols: Optional[Callable[[str], bool]],
+                        dtypes: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """
+        Lê CSV com o leitor multithread do pyarrow sobre arquivo mapeado em memória
+        
+        Apenas as colunas selecionadas são convertidas; o resultado usa
+        colunas Arrow (equivalente a dtype_backend='pyarrow').
+        
+        Args:
+            file_path: Caminho do arquivo
+            usecols: Filtro de colunas (None = todas)
+            dtypes: Tipos por coluna, aplicados após a leitura
+        
+        Returns:
+            DataFrame com colunas Arrow
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        
+        # Cabeçalho lido à parte para montar include_columns
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            header = next(csv.reader(f), [])
+        include = [col for col in header if usecols is None or usecols(col)]
+        
+        with pa.memory_map(file_path, 'r') as source:
+            table = pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                # Campos vazios viram nulos, como no leitor do pandas
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=include,
+                    strings_can_be_null=True,
+                    quoted_strings_can_be_null=True
+                )
+            )
+        
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        self.logger.debug(f"CSV lido via pyarrow: {table.num_rows} linhas, {table.nbytes / 1024:.1f} KB")
+        
+        if dtypes:
+            df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+        return df
+    
     def process_api_data(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
         """
         Converte dados JSON da API em DataFrame
@@ -70,6 +266,37 @@ class DataProcessor:
             self.logger.error(f"Erro ao converter dados da API: {e}")
             raise
     
+    def process_api_pages(self, pages: Iterable[List[Dict[str, Any]]]) -> pd.DataFrame:
+        """
+        Converte páginas da API em DataFrame, uma página por vez
+        
+        Cada página é convertida e descartada antes da próxima, de modo que a
+        lista JSON completa nunca fica em memória (ver APIClient.iter_pages).
+        
+        Args:
+            pages: Iterável de listas de registros da API
+        
+        Returns:
+            DataFrame com todas as páginas
+        """
+        self.logger.info("Convertendo páginas da API em DataFrame")
+        
+        try:
+            frames = [pd.DataFrame(page) for page in pages if page]
+            
+            if frames:
+                df = pd.concat(frames, ignore_index=True)
+            else:
+                df = pd.DataFrame()
+            
+            self.logger.info(f"✓ DataFrame criado a partir de {len(frames)} páginas: "
+                             f"{len(df)} linhas, {len(df.columns)} colunas")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Erro ao converter páginas da API: {e}")
+            raise
+    
     def normalize_columns(self, df: pd.DataFrame, source: str) -> pd.DataFrame:
         """
         Normaliza nomes de colunas conforme mapeamento
@@ -101,6 +328,10 @@ class DataProcessor:
         """
         Traduz códigos técnicos de status para valores legíveis
         
+        A coluna resultante é categórica: as categorias são os valores de
+        `status_translation` (na ordem do config), seguidas dos códigos sem
+        tradução, que são mantidos como estão.
+        
         Args:
             df: DataFrame
             column: Nome da coluna de status
@@ -117,42 +348,219 @@ class DataProcessor:
         if not translation:
             return df
         
-        # Aplicar tradução
-        df[column] = df[column].map(lambda x: translation.get(str(x).upper(), x))
+        lookup = {str(code).upper(): label for code, label in translation.items()}
+        labels = list(dict.fromkeys(translation.values()))
+        
+        # Upper e lookup aplicados uma vez por valor distinto, não por linha
+        codes, uniques = pd.factorize(df[column])
+        uniques = pd.Index(uniques, dtype=object)
+        translated = pd.Series(uniques.astype(str).str.upper()).map(lookup)
+        unmapped = translated.isna().to_numpy() & ~uniques.isin(labels)
+        translated = translated.where(translated.notna(), pd.Series(uniques, dtype=object))
+        
+        categories = pd.Index(labels + [code for code in translated if code not in labels], dtype=object)
+        # -1 extra no fim: nulos (código -1) continuam nulos, mesmo sem nenhum valor distinto
+        category_codes = np.append(categories.get_indexer(translated), -1)
+        df[column] = pd.Categorical.from_codes(category_codes[codes], categories=categories)
+        
+        # Códigos sem tradução, com a quantidade de linhas de cada um
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        unmapped_counts = {uniques[i]: int(counts[i]) for i in np.flatnonzero(unmapped)}
+        if unmapped_counts:
+            summary = ', '.join(f"{code} ({count})" for code, count in unmapped_counts.items())
+            self.logger.warning(f"Status sem tradução na coluna '{column}': {summary}")
         
         self.logger.info(f"✓ Status traduzidos na coluna '{column}'")
         return df
     
-    def normalize_dates(self, df: pd.DataFrame, date_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def _date_columns(self, names: Iterable[str]) -> List[str]:
+        """
+        Auto-detecta colunas de data
+        
+        Considera nomes com 'data'/'date', o prefixo 'dt_' (ex.: dt_inicio)
+        e as colunas com formato declarado em `date_formats`.
+        
+        Args:
+            names: Nomes das colunas do DataFrame
+        
+        Returns:
+            Lista de colunas
+        """
+        declared = self.config.get('date_formats', {})
+        columns = []
+        for col in names:
+            name = str(col).lower()
+            if 'data' in name or 'date' in name or name.startswith('dt_') or col in declared:
+                columns.append(col)
+        return columns
+    
+    def _infer_date_format(self, col: str, values: pd.Index, source: Optional[str] = None) -> Optional[str]:
+        """
+        Escolhe, uma única vez por fonte e coluna, o formato de entrada das datas
+        
+        Testa os formatos de `date_input_formats` numa amostra dos valores
+        distintos e guarda o que converte mais valores. As fontes têm
+        formatos próprios para a mesma coluna normalizada (ex.: `data`).
+        
+        Args:
+            col: Nome da coluna
+            values: Valores distintos não nulos
+            source: Fonte de origem ('fonte1', 'fonte2'; None = fontes já unificadas)
+        
+        Returns:
+            Formato strptime, 'ISO8601' ou None (inferência do pandas)
+        """
+        declared = self.config.get('date_formats', {})
+        if col in declared:
+            return declared[col]
+        if (source, col) in self._date_formats:
+            return self._date_formats[(source, col)]
+        
+        sample = values[:200]
+        best, best_parsed = None, 0
+        for fmt in self.config.get('date_input_formats', DEFAULT_DATE_INPUT_FORMATS):
+            parsed = self._to_datetime(sample, fmt).notna().sum()
+            if parsed > best_parsed:
+                best, best_parsed = fmt, parsed
+            if parsed == len(sample):
+                break
+        
+        if best is None:
+            self.logger.warning(f"Nenhum formato de data reconhecido na coluna '{col}', usando inferência do pandas")
+        else:
+            self.logger.debug(f"Formato de data da coluna '{col}': {best}")
+        self._date_formats[(source, col)] = best
+        return best
+    
+    def _to_datetime(self, values: pd.Index, fmt: Optional[str]) -> pd.DatetimeIndex:
+        """
+        Converte valores para datetime no timezone configurado (inválidos viram NaT)
+        
+        Valores sem offset são localizados no timezone configurado; valores
+        com offset são convertidos para ele.
+        
+        Args:
+            values: Valores a converter
+            fmt: Formato de entrada (None = inferência do pandas)
+        
+        Returns:
+            DatetimeIndex com timezone
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            try:
+                parsed = self.backend.strptime(values, fmt) if self.backend is not None else None
+                if parsed is None:
+                    parsed = pd.to_datetime(values, format=fmt, errors='coerce')
+            except ValueError:
+                parsed = pd.to_datetime(values, format=fmt, errors='coerce', utc=True)
+        
+        if isinstance(parsed, pd.DatetimeIndex):
+            return self._localize(parsed)
+        
+        # Mistura de valores com e sem offset: cada grupo é tratado à parte
+        aware = np.array([getattr(value, 'tzinfo', None) is not None for value in parsed])
+        result = np.full(len(parsed), pd.NaT.value, dtype='int64')
+        if aware.any():
+            result[aware] = pd.to_datetime(parsed[aware], utc=True).asi8
+        if (~aware).any():
+            result[~aware] = self._localize(pd.DatetimeIndex(parsed[~aware])).asi8
+        return pd.DatetimeIndex(pd.to_datetime(result, utc=True)).tz_convert(self.timezone)
+    
+    def _localize(self, values: pd.DatetimeIndex) -> pd.DatetimeIndex:
+        """
+        Aplica o timezone configurado, tratando explicitamente as transições de horário de verão
+        
+        Args:
+            values: Datas (com ou sem timezone)
+        
+        Returns:
+            Datas no timezone configurado
+        """
+        if values.tz is not None:
+            return values.tz_convert(self.timezone)
+        
+        # Hora repetida no fim do horário de verão: 'earliest' = primeira ocorrência
+        ambiguous = self.config.get('dst_ambiguous', 'earliest')
+        if ambiguous in ('earliest', 'latest'):
+            ambiguous = np.full(len(values), ambiguous == 'earliest')
+        
+        return values.tz_localize(
+            self.timezone,
+            ambiguous=ambiguous,
+            nonexistent=self.config.get('dst_nonexistent', 'shift_forward')
+        )
+    
+    def _parse_dates(self, series: pd.Series, col: str, source: Optional[str] = None) -> pd.Series:
+        """
+        Converte uma coluna para datetime com timezone
+        
+        Cada valor distinto é convertido uma única vez e o resultado é
+        expandido de volta para as linhas pelos códigos do factorize.
+        
+        Args:
+            series: Coluna original
+            col: Nome da coluna
+            source: Fonte de origem (chave do formato inferido)
+        
+        Returns:
+            Coluna datetime com timezone
+        """
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return pd.Series(self._localize(pd.DatetimeIndex(series)), index=series.index, name=series.name)
+        
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Index(uniques)
+        fmt = self._infer_date_format(col, uniques, source) if len(uniques) else None
+        
+        parsed = self._to_datetime(uniques, fmt)
+        
+        # Valores em outro formato (ex.: colunas unificadas de fontes diferentes)
+        missing = np.flatnonzero(parsed.isna() & ~pd.isna(uniques))
+        if len(missing) and col not in self.config.get('date_formats', {}):
+            values = parsed.asi8.copy()
+            for other in self.config.get('date_input_formats', DEFAULT_DATE_INPUT_FORMATS):
+                if other == fmt or not len(missing):
+                    continue
+                retry = self._to_datetime(uniques[missing], other)
+                ok = retry.notna()
+                values[missing[ok]] = retry.asi8[ok]
+                missing = missing[~ok]
+            parsed = pd.DatetimeIndex(pd.to_datetime(values, utc=True)).tz_convert(self.timezone)
+        
+        return pd.Series(
+            parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+            index=series.index,
+            name=series.name
+        )
+    
+    def normalize_dates(self, df: pd.DataFrame, date_columns: Optional[List[str]] = None,
+                        source: Optional[str] = None) -> pd.DataFrame:
         """
         Normaliza colunas de data para formato padrão
         
+        O formato de entrada vem de `date_formats` (por coluna) ou é inferido
+        uma vez entre `date_input_formats`; `dst_ambiguous`/`dst_nonexistent`
+        definem o tratamento das horas de transição do horário de verão.
+        
         Args:
             df: DataFrame
             date_columns: Lista de colunas de data (auto-detecta se None)
+            source: Fonte de origem ('fonte1', 'fonte2'); o formato inferido é guardado por fonte
         
         Returns:
             DataFrame com datas normalizadas
         """
         if date_columns is None:
-            # Auto-detectar colunas com 'data' ou 'date' no nome
-            date_columns = [col for col in df.columns if 'data' in col.lower() or 'date' in col.lower()]
-        
-        date_format = self.config.get('date_format', '%d/%m/%Y %H:%M')
+            date_columns = self._date_columns(df.columns)
         
         for col in date_columns:
             if col not in df.columns:
                 continue
             
             try:
-                # Converter para datetime
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-                
-                # Aplicar timezone
-                if df[col].dt.tz is None:
-                    df[col] = df[col].dt.tz_localize(self.timezone)
-                else:
-                    df[col] = df[col].dt.tz_convert(self.timezone)
+                # Converter para datetime e aplicar timezone
+                df[col] = self._parse_dates(df[col], col, source)
                 
                 self.logger.info(f"✓ Coluna '{col}' normalizada para datetime com timezone {self.timezone}")
                 
@@ -176,10 +584,24 @@ class DataProcessor:
         if null_counts.sum() > 0:
             self.logger.info(f"Valores nulos encontrados:\n{null_counts[null_counts > 0]}")
         
-        # Preencher nulos em colunas de texto com string vazia
-        text_columns = df.select_dtypes(include=['object']).columns
+        # Preencher nulos em colunas de texto com string vazia (inclui strings Arrow)
+        text_columns = [
+            col for col in df.columns
+            if df[col].dtype == object or (
+                isinstance(df[col].dtype, (pd.StringDtype, pd.ArrowDtype))
+                and pd.api.types.is_string_dtype(df[col].dtype)
+            )
+        ]
         df[text_columns] = df[text_columns].fillna('')
         
+        # Colunas categóricas de texto: '' entra como categoria (mantém o dtype category)
+        for col in df.columns:
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype) and dtype.categories.dtype == object and df[col].hasnans:
+                if '' not in dtype.categories:
+                    df[col] = df[col].cat.add_categories('')
+                df[col] = df[col].fillna('')
+        
         # Preencher nulos em colunas numéricas com 0
         numeric_columns = df.select_dtypes(include=['number']).columns
         df[numeric_columns] = df[numeric_columns].fillna(0)
@@ -191,6 +613,10 @@ class DataProcessor:
         """
         Unifica datasets de Fonte 1 e Fonte 2
         
+        Duplicatas são identificadas pela chave de negócio em
+        `deduplication.key` (ex.: id_mostra); sem chave, por todas as colunas
+        exceto `fonte`. Os DataFrames de entrada não são alterados.
+        
         Args:
             df1: DataFrame da Fonte 1
             df2: DataFrame da Fonte 2
@@ -200,28 +626,235 @@ class DataProcessor:
         """
         self.logger.info(f"Unificando datasets: Fonte1({len(df1)} linhas) + Fonte2({len(df2)} linhas)")
         
-        # Adicionar coluna de origem
-        df1['fonte'] = 'Fonte 1'
-        df2['fonte'] = 'Fonte 2'
+        # Garantir que ambos tenham as mesmas colunas (cópias alinhadas, com coluna de origem)
+        columns = df1.columns.append(df2.columns.difference(df1.columns, sort=False))
+        columns = columns.drop('fonte', errors='ignore').append(pd.Index(['fonte']))
+        df1 = df1.assign(fonte='Fonte 1').reindex(columns=columns)
+        df2 = df2.assign(fonte='Fonte 2').reindex(columns=columns)
         
-        # Garantir que ambos tenham as mesmas colunas
-        all_columns = set(df1.columns) | set(df2.columns)
+        # Categorias unificadas: sem isso o concat converte as colunas para object
+        self._align_categories(df1, df2)
         
-        for col in all_columns:
-            if col not in df1.columns:
-                df1[col] = None
-            if col not in df2.columns:
-                df2[col] = None
-        
-        # Concatenar
-        df_merged = pd.concat([df1, df2], ignore_index=True)
+        # Concatenar (colunas ausentes numa das fontes ficam nulas)
+        frames = [df for df in (df1, df2) if not df.empty]
+        df_merged = pd.concat(frames, ignore_index=True) if frames else df1
         
         # Remover duplicatas (se houver)
-        df_merged = df_merged.drop_duplicates()
+        df_merged = self.drop_duplicate_records(df_merged)
         
         self.logger.info(f"✓ Datasets unificados: {len(df_merged)} linhas totais")
         return df_merged
     
+    def drop_duplicate_records(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remove registros duplicados pela chave de negócio
+        
+        Apenas as colunas da chave são hasheadas. `deduplication.keep` define
+        qual registro sobrevive: 'fonte1' ou 'fonte2' (prioridade da origem)
+        ou 'latest' (maior valor de `deduplication.order_by`, ex.: dt_fim).
+        Com chave de negócio, linhas com chave nula não são deduplicadas; na
+        comparação pela linha inteira, nulos contam como valores iguais.
+        
+        Args:
+            df: DataFrame consolidado (com coluna `fonte`)
+        
+        Returns:
+            DataFrame sem duplicatas, na ordem original
+        """
+        config = self.config.get('deduplication', {})
+        key = [col for col in config.get('key', []) if col in df.columns]
+        
+        if len(key) < len(config.get('key', [])):
+            self.logger.warning(f"Chave de deduplicação incompleta no DataFrame: {config.get('key')}, usando linha inteira")
+            key = []
+        business_key = bool(key)
+        if not key:
+            key = [col for col in df.columns if col != 'fonte']
+        
+        if df.empty or not key:
+            return df
+        
+        hashes = KeyIndex.hash_rows(df, key)
+        
+        order = self._dedup_order(df, config)
+        duplicated = np.zeros(len(df), dtype=bool)
+        duplicated[order] = pd.Series(hashes[order]).duplicated(keep='first').to_numpy()
+        if business_key:
+            duplicated &= df[key].notna().all(axis=1).to_numpy()
+        
+        dropped = int(duplicated.sum())
+        if dropped:
+            self.logger.info(f"Duplicatas removidas por {', '.join(key[:5])}{'...' if len(key) > 5 else ''}: {dropped}")
+        return df[~duplicated]
+    
+    def _dedup_order(self, df: pd.DataFrame, config: dict) -> np.ndarray:
+        """
+        Ordem de prioridade das linhas: a primeira ocorrência de cada chave é mantida
+        
+        Args:
+            df: DataFrame consolidado
+            config: Configuração `deduplication`
+        
+        Returns:
+            Posições das linhas, da mais para a menos prioritária
+        """
+        keep = config.get('keep', 'fonte1')
+        positions = np.arange(len(df))
+        
+        if keep == 'latest':
+            column = config.get('order_by')
+            if column in df.columns:
+                values = df[column]
+                if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+                    values = self._parse_dates(values, column)
+                # Mais recente primeiro; sem data por último
+                sort_key = values.to_numpy(dtype='datetime64[ns]').astype('int64')
+                sort_key = np.where(values.isna().to_numpy(), np.iinfo('int64').max, -sort_key)
+                return np.argsort(sort_key, kind='stable')
+            self.logger.warning(f"Coluna '{column}' de deduplicação ausente, mantendo a primeira ocorrência")
+        elif keep == 'fonte2' and 'fonte' in df.columns:
+            return np.argsort((df['fonte'] != 'Fonte 2').to_numpy(), kind='stable')
+        
+        return positions
+    
+    @staticmethod
+    def _align_categories(df1: pd.DataFrame, df2: pd.DataFrame):
+        """
+        Dá às colunas categóricas de ambos os DataFrames o mesmo conjunto de categorias
+        
+        Args:
+            df1: DataFrame da Fonte 1 (alterado no lugar)
+            df2: DataFrame da Fonte 2 (alterado no lugar)
+        """
+        for col in df1.columns.intersection(df2.columns):
+            left, right = df1[col], df2[col]
+            if not (isinstance(left.dtype, pd.CategoricalDtype) or isinstance(right.dtype, pd.CategoricalDtype)):
+                continue
+            
+            categories = pd.Index([])
+            for series in (left, right):
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    values = series.cat.categories
+                else:
+                    values = pd.Index(series.dropna().unique())
+                categories = categories.append(values.difference(categories, sort=False))
+            
+            dtype = pd.CategoricalDtype(categories)
+            df1[col] = left.astype(dtype)
+            df2[col] = right.astype(dtype)
+    
+    def compact_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reduz o uso de memória do DataFrame
+        
+        Colunas de texto com poucos valores distintos (proporção de distintos
+        por linha até `compaction.category_threshold`) viram `category`;
+        colunas numéricas são rebaixadas para o menor tipo que representa
+        exatamente os mesmos valores.
+        
+        Args:
+            df: DataFrame
+        
+        Returns:
+            DataFrame compactado
+        """
+        config = self.config.get('compaction', {})
+        threshold = float(config.get('category_threshold', 0.1))
+        
+        if df.empty:
+            return df
+        
+        memory_before = df.memory_usage(deep=True).sum()
+        categorized, downcast = [], []
+        
+        for col in df.columns:
+            series = df[col]
+            
+            is_text = series.dtype == object or (
+                pd.api.types.is_string_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype)
+            )
+            
+            if is_text:
+                try:
+                    unique = series.nunique(dropna=True)
+                except TypeError:
+                    # Valores não hashable (listas/dicts vindos da API)
+                    continue
+                if unique / len(series) <= threshold:
+                    df[col] = series.astype('category')
+                    categorized.append(col)
+            
+            elif config.get('downcast_numeric', True) and pd.api.types.is_numeric_dtype(series.dtype) \
+                    and not pd.api.types.is_bool_dtype(series.dtype) and isinstance(series.dtype, np.dtype):
+                kind = 'integer' if pd.api.types.is_integer_dtype(series.dtype) else 'float'
+                if kind == 'float' and series.notna().all() and (series % 1 == 0).all():
+                    kind = 'integer'
+                compact = pd.to_numeric(series, downcast=kind)
+                if compact.dtype != series.dtype and (compact == series).all():
+                    df[col] = compact
+                    downcast.append(f"{col} ({series.dtype} → {compact.dtype})")
+        
+        memory_after = df.memory_usage(deep=True).sum()
+        if categorized:
+            self.logger.info(f"Colunas convertidas para category: {', '.join(categorized)}")
+        if downcast:
+            self.logger.info(f"Colunas numéricas rebaixadas: {', '.join(downcast)}")
+        self.logger.info(f"✓ Tipos compactados: memória {memory_before / 1024:.1f} KB → {memory_after / 1024:.1f} KB")
+        return df
+    
+    def prepare_source(self, df: pd.DataFrame, source: str) -> pd.DataFrame:
+        """
+        Normalização de uma fonte isolada (colunas, datas e status)
+        
+        Independe da outra fonte, de modo que as duas podem ser preparadas
+        em paralelo antes de `finalize`. Com `backend: polars`, roda em
+        Polars; tipos sem equivalente exato voltam para pandas.
+        
+        Args:
+            df: DataFrame da fonte
+            source: 'fonte1' ou 'fonte2'
+        
+        Returns:
+            DataFrame normalizado
+        """
+        if self.backend is not None:
+            try:
+                return self.backend.prepare_source(df, source)
+            except NotImplementedError as e:
+                self.logger.warning(f"Backend polars não suporta {source} ({e}), usando pandas")
+        
+        df = self.normalize_columns(df, source)
+        df = self.normalize_dates(df, source=source)
+        if 'status' in df.columns:
+            df = self.translate_status(df)
+        return df
+    
+    def finalize(self, df1: pd.DataFrame, df2: pd.DataFrame) -> pd.DataFrame:
+        """
+        Unifica as fontes preparadas, trata nulos e compacta os tipos
+        
+        Args:
+            df1: Fonte 1 após prepare_source
+            df2: Fonte 2 após prepare_source
+        
+        Returns:
+            DataFrame processado e unificado
+        """
+        df_merged = None
+        if self.backend is not None:
+            try:
+                df_merged = self.backend.merge_and_fill(df1, df2)
+            except NotImplementedError as e:
+                self.logger.warning(f"Backend polars não suporta a unificação ({e}), usando pandas")
+        
+        if df_merged is None:
+            df_merged = self.merge_datasets(df1, df2)
+            df_merged = self.handle_missing_values(df_merged)
+        
+        if self.config.get('compaction', {}).get('enabled', True):
+            df_merged = self.compact_dtypes(df_merged)
+        return df_merged
+    
     def process_full_pipeline(self, excel_file: str, api_data: List[Dict]) -> pd.DataFrame:
         """
         Pipeline completo de processamento
@@ -233,30 +866,383 @@ class DataProcessor:
         Returns:
             DataFrame processado e unificado
         """
+        if self.config.get('chunked', {}).get('enabled', False):
+            return self.process_chunked_frame(excel_file, api_data)
+        
         self.logger.info("=== Iniciando pipeline de processamento ===")
         
-        # 1. Carregar Fonte 1
+        # 1. Carregar e normalizar Fonte 1 (colunas, datas, status)
         df1 = self.load_excel_data(excel_file)
-        df1 = self.normalize_columns(df1, 'fonte1')
+        df1 = self.prepare_source(df1, 'fonte1')
         
-        # 2. Processar Fonte 2
+        # 2. Processar e normalizar Fonte 2
         df2 = self.process_api_data(api_data)
-        df2 = self.normalize_columns(df2, 'fonte2')
+        df2 = self.prepare_source(df2, 'fonte2')
         
-        # 3. Unificar
-        df_merged = self.merge_datasets(df1, df2)
+        # 3. Unificar, tratar valores nulos e compactar tipos
+        df_merged = self.finalize(df1, df2)
         
-        # 4. Normalizar datas
-        df_merged = self.normalize_dates(df_merged)
+        self.logger.info(f"=== Pipeline concluído: {len(df_merged)} registros finais ===")
+        return df_merged
+    
+    def _business_key(self, df: pd.DataFrame) -> List[str]:
+        """
+        Colunas da chave de negócio (`change_detection.key` ou `deduplication.key`)
         
-        # 5. Traduzir status
-        df_merged = self.translate_status(df_merged)
+        Args:
+            df: DataFrame normalizado
         
-        # 6. Tratar valores nulos
-        df_merged = self.handle_missing_values(df_merged)
+        Returns:
+            Lista de colunas
+        """
+        key = self.config.get('change_detection', {}).get('key') or self.config.get('deduplication', {}).get('key')
+        if not key:
+            raise ValueError("Detecção de mudanças requer change_detection.key ou deduplication.key")
         
-        self.logger.info(f"=== Pipeline concluído: {len(df_merged)} registros finais ===")
-        return df_merged
+        missing = [col for col in key if col not in df.columns]
+        if missing:
+            raise ValueError(f"Colunas da chave ausentes no DataFrame: {missing}")
+        return list(key)
+    
+    def detect_changes(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Compara o DataFrame normalizado com a execução anterior
+        
+        Cada linha recebe um hash do conteúdo, comparado ao hash gravado para
+        a mesma chave de negócio. As etapas seguintes podem trabalhar só com
+        `added` e `changed`; o estado só avança com `commit_changes`.
+        
+        Args:
+            df: DataFrame normalizado (ex.: saída de process_full_pipeline)
+        
+        Returns:
+            Dicionário com 'added', 'changed' e 'removed' (ver ChangeTracker.detect)
+        """
+        return self.change_tracker.detect(df, self._business_key(df))
+    
+    def commit_changes(self, df: pd.DataFrame, changes: Dict[str, pd.DataFrame], removals: bool = True):
+        """
+        Grava o estado de `detect_changes` após o sucesso das etapas seguintes
+        
+        Args:
+            df: DataFrame passado a detect_changes
+            changes: Resultado de detect_changes
+            removals: Se as linhas ausentes são gravadas como removidas (só com coleta completa)
+        """
+        self.change_tracker.commit(df, self._business_key(df), changes, removals)
+    
+    def iter_source_chunks(self, file_path: str, source: str = 'fonte1',
+                           chunk_rows: int = 50000) -> Iterator[pd.DataFrame]:
+        """
+        Lê a planilha/CSV em blocos de linhas
+        
+        Seleciona as mesmas colunas e tipos de `load_excel_data`. Arquivos .xlsx
+        são percorridos linha a linha (openpyxl em modo read_only) e CSV com
+        `chunksize`; .xls não tem leitura incremental e é carregado inteiro.
+        
+        Args:
+            file_path: Caminho do arquivo
+            source: Origem, para selecionar mapeamento e tipos
+            chunk_rows: Linhas por bloco
+        
+        Yields:
+            DataFrames de até `chunk_rows` linhas
+        """
+        self.logger.info(f"Lendo planilha em blocos de {chunk_rows} linhas: {file_path}")
+        
+        wanted = self._source_columns(source)
+        dtypes = self.config.get('column_dtypes', {}).get(source) or None
+        
+        if file_path.endswith('.csv'):
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                header = next(csv.reader(f), [])
+            usecols = [col for col in header if not wanted or col in wanted] or None
+            with pd.read_csv(file_path, encoding='utf-8-sig', usecols=usecols, dtype=dtypes,
+                             chunksize=chunk_rows) as reader:
+                yield from reader
+            return
+        
+        if file_path.lower().endswith('.xls'):
+            self.logger.warning("Formato .xls sem leitura incremental, carregando planilha inteira")
+            df = self.load_excel_data(file_path, source)
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start:start + chunk_rows]
+            return
+        
+        yield from self._iter_xlsx_chunks(file_path, wanted, dtypes, chunk_rows)
+    
+    def _iter_xlsx_chunks(self, file_path: str, wanted: Optional[set], dtypes: Optional[Dict[str, str]],
+                          chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Percorre a primeira aba de um .xlsx sem carregá-la inteira
+        
+        Args:
+            file_path: Caminho do arquivo
+            wanted: Colunas a manter (None = todas)
+            dtypes: Tipos por coluna
+            chunk_rows: Linhas por bloco
+        
+        Yields:
+            DataFrames de até `chunk_rows` linhas
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = list(next(rows, ()))
+            
+            positions = [i for i, col in enumerate(header) if col is not None and (not wanted or col in wanted)]
+            if wanted and not positions:
+                self.logger.warning("Nenhuma coluna mapeada encontrada na planilha, carregando todas")
+                positions = [i for i, col in enumerate(header) if col is not None]
+            names = [header[i] for i in positions]
+            
+            batch = []
+            blank = 0
+            for row in rows:
+                # Como no read_excel: linhas vazias no meio são mantidas, as do fim descartadas
+                if all(value is None for value in row):
+                    blank += 1
+                    continue
+                batch.extend([None] * len(positions) for _ in range(blank))
+                blank = 0
+                
+                batch.append([row[i] if i < len(row) else None for i in positions])
+                if len(batch) >= chunk_rows:
+                    yield self._rows_to_frame(batch, names, dtypes)
+                    batch = []
+            
+            if batch:
+                yield self._rows_to_frame(batch, names, dtypes)
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _rows_to_frame(rows: List[list], names: List[str], dtypes: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """Monta o DataFrame de um bloco e aplica os tipos declarados"""
+        df = pd.DataFrame(rows, columns=names)
+        if dtypes:
+            df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+        return df
+    
+    @staticmethod
+    def _iter_api_chunks(api_data: Iterable, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Agrupa os dados da API em blocos de linhas
+        
+        Args:
+            api_data: Lista de registros ou iterável de páginas (APIClient.iter_pages)
+            chunk_rows: Linhas por bloco
+        
+        Yields:
+            DataFrames de aproximadamente `chunk_rows` linhas
+        """
+        if isinstance(api_data, list) and (not api_data or isinstance(api_data[0], dict)):
+            pages = (api_data[start:start + chunk_rows] for start in range(0, len(api_data), chunk_rows))
+        else:
+            pages = api_data
+        
+        batch = []
+        for page in pages:
+            batch.extend(page)
+            if len(batch) >= chunk_rows:
+                yield pd.DataFrame(batch)
+                batch = []
+        
+        if batch:
+            yield pd.DataFrame(batch)
+    
+    def process_chunked_frame(self, excel_file: Optional[str], api_data: Optional[Iterable]) -> pd.DataFrame:
+        """
+        Executa `process_chunked` e carrega o resultado (usado com `chunked.enabled`)
+        
+        A normalização e a deduplicação rodam com memória limitada ao
+        bloco; só o resultado final, já deduplicado, é carregado.
+        
+        Args:
+            excel_file: Caminho da planilha (Fonte 1) ou None se desativada
+            api_data: Registros ou páginas da API (Fonte 2) ou None se desativada
+        
+        Returns:
+            DataFrame processado e unificado
+        """
+        stats = self.process_chunked(excel_file, api_data)
+        df = self.read_chunked_output(stats['output'])
+        
+        if self.config.get('compaction', {}).get('enabled', True):
+            df = self.compact_dtypes(df)
+        return df
+    
+    def process_chunked(self, excel_file: Optional[str], api_data: Optional[Iterable],
+                        output_dir: Optional[str] = None,
+                        sink: Optional[Callable[[pd.DataFrame, int], None]] = None) -> Dict[str, Any]:
+        """
+        Pipeline completo em blocos, com memória limitada ao tamanho do bloco
+        
+        Fonte 1 é lida em blocos de `chunked.chunk_rows` linhas e Fonte 2 é
+        consumida página a página. Cada bloco passa por normalize_columns →
+        normalize_dates → translate_status → handle_missing_values, é
+        deduplicado contra um índice limitado de chaves (`deduplication.key`)
+        e entregue ao `sink` ou gravado como parte de um dataset Parquet.
+        
+        A deduplicação mantém a primeira ocorrência na ordem de leitura;
+        com `keep: fonte2` a Fonte 2 é processada primeiro. `keep: latest`
+        não é suportado neste modo.
+        
+        Args:
+            excel_file: Caminho da planilha (Fonte 1) ou None se desativada
+            api_data: Registros da API ou iterável de páginas (Fonte 2) ou None se desativada
+            output_dir: Diretório do dataset Parquet (usa config se None)
+            sink: Função chamada com (bloco, número do bloco) no lugar da gravação
+        
+        Returns:
+            Dicionário com rows, duplicates, parts e output
+        """
+        self.logger.info("=== Iniciando pipeline de processamento em blocos ===")
+        
+        config = self.config.get('chunked', {})
+        chunk_rows = int(config.get('chunk_rows', 50000))
+        dedup = self.config.get('deduplication', {})
+        keep = dedup.get('keep', 'fonte1')
+        
+        if keep == 'latest':
+            self.logger.warning("keep: latest não é suportado em blocos, mantendo a primeira ocorrência")
+        
+        streams = {}
+        if excel_file is not None:
+            streams['fonte1'] = self.iter_source_chunks(excel_file, 'fonte1', chunk_rows)
+        if api_data is not None:
+            streams['fonte2'] = self._iter_api_chunks(api_data, chunk_rows)
+        
+        # Primeiro bloco de cada fonte define as colunas de saída e seus tipos
+        firsts = {}
+        for source, chunks in streams.items():
+            first = next(chunks, None)
+            if first is not None:
+                firsts[source] = self.normalize_columns(first, source)
+        
+        columns = pd.Index([])
+        numeric: Dict[str, bool] = {}
+        for first in firsts.values():
+            columns = columns.append(first.columns.difference(columns, sort=False))
+            for col in first.columns:
+                numeric[col] = numeric.get(col, True) and pd.api.types.is_numeric_dtype(first[col].dtype)
+        columns = columns.drop('fonte', errors='ignore').append(pd.Index(['fonte']))
+        
+        key = [col for col in dedup.get('key', []) if col in columns]
+        if len(key) < len(dedup.get('key', [])):
+            self.logger.warning(f"Chave de deduplicação incompleta nos dados: {dedup.get('key')}, usando linha inteira")
+            key = []
+        business_key = bool(key)
+        key = key or [col for col in columns if col != 'fonte']
+        
+        if sink is None:
+            sink, output_dir = self._parquet_sink(output_dir or config.get('output_dir', 'temp/pipeline_output'))
+        
+        index = KeyIndex(int(config.get('max_keys', 10_000_000)), self.logger)
+        order = ['fonte2', 'fonte1'] if keep == 'fonte2' else ['fonte1', 'fonte2']
+        stats = {'rows': 0, 'duplicates': 0, 'parts': 0, 'output': output_dir}
+        
+        for source in order:
+            if source not in firsts:
+                continue
+            label = 'Fonte 1' if source == 'fonte1' else 'Fonte 2'
+            
+            for number, chunk in enumerate(itertools.chain([firsts.pop(source)], streams[source])):
+                if number:
+                    chunk = self.normalize_columns(chunk, source)
+                chunk = self._process_chunk(chunk, source, label, columns, numeric)
+                
+                hashes = KeyIndex.hash_rows(chunk, key)
+                # Chave nula só protege a linha quando há chave de negócio (como em drop_duplicate_records)
+                valid = chunk[key].notna().all(axis=1).to_numpy() if business_key else np.ones(len(chunk), dtype=bool)
+                mask = index.filter_new(hashes, valid)
+                stats['duplicates'] += int((~mask).sum())
+                chunk = self.handle_missing_values(chunk[mask].reset_index(drop=True))
+                
+                if len(chunk):
+                    sink(chunk, stats['parts'])
+                    stats['parts'] += 1
+                    stats['rows'] += len(chunk)
+        
+        self.logger.info(f"Duplicatas removidas: {stats['duplicates']}")
+        self.logger.info(f"=== Pipeline em blocos concluído: {stats['rows']} registros em {stats['parts']} blocos ===")
+        return stats
+    
+    def _process_chunk(self, chunk: pd.DataFrame, source: str, label: str, columns: pd.Index,
+                       numeric: Dict[str, bool]) -> pd.DataFrame:
+        """
+        Alinha as colunas de um bloco e aplica datas e tradução de status
+        
+        Args:
+            chunk: Bloco com colunas já normalizadas
+            source: 'fonte1' ou 'fonte2'
+            label: Valor da coluna `fonte`
+            columns: Colunas de saída
+            numeric: Se cada coluna é numérica (para criar as ausentes com o tipo certo)
+        
+        Returns:
+            Bloco processado
+        """
+        extra = chunk.columns.difference(columns)
+        if len(extra):
+            self.logger.warning(f"Colunas fora do primeiro bloco ignoradas: {list(extra)}")
+        
+        # Colunas ausentes no bloco: nulas, como object quando são texto na outra fonte
+        missing = columns.difference(chunk.columns.append(pd.Index(['fonte'])))
+        chunk = chunk.assign(fonte=label).reindex(columns=columns)
+        for col in missing:
+            if not numeric.get(col, False):
+                chunk[col] = chunk[col].astype(object)
+        
+        chunk = self.normalize_dates(chunk, source=source)
+        chunk = self.translate_status(chunk)
+        return chunk
+    
+    def _parquet_sink(self, output_dir: str):
+        """
+        Prepara o diretório do dataset Parquet e a função que grava cada bloco
+        
+        Args:
+            output_dir: Diretório de saída (partes anteriores são removidas)
+        
+        Returns:
+            (função de gravação, diretório)
+        """
+        if not HAS_PYARROW:
+            raise RuntimeError("pyarrow não instalado - saída Parquet indisponível")
+        
+        os.makedirs(output_dir, exist_ok=True)
+        for old_part in glob.glob(os.path.join(output_dir, 'part-*.parquet')):
+            os.remove(old_part)
+        
+        def write(chunk: pd.DataFrame, number: int):
+            chunk.to_parquet(os.path.join(output_dir, f"part-{number:05d}.parquet"), index=False)
+        
+        return write, output_dir
+    
+    @staticmethod
+    def read_chunked_output(output_dir: str) -> pd.DataFrame:
+        """
+        Carrega o dataset Parquet gravado por `process_chunked`
+        
+        Args:
+            output_dir: Diretório do dataset
+        
+        Returns:
+            DataFrame com todas as partes (esquemas unificados)
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+        
+        parts = sorted(glob.glob(os.path.join(output_dir, 'part-*.parquet')))
+        if not parts:
+            return pd.DataFrame()
+        
+        schema = pa.unify_schemas([pq.read_schema(part) for part in parts], promote_options='permissive')
+        return ds.dataset(parts, schema=schema, format='parquet').to_table().to_pandas()
     
     def filter_columns(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -0,0 +1,159 @@
+"""
+Cache de DataFrames endereçado por conteúdo (Parquet/Feather)
+"""
+import os
+import json
+import hashlib
+import logging
+import importlib.util
+from typing import Any, Dict, Optional
+import pandas as pd
+
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+class FrameCache:
+    """Armazena DataFrames carregados, indexados pelo hash do arquivo + configurações do leitor"""
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa o cache
+        
+        Args:
+            config: Configuração `processing.frame_cache`
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.cache_dir = config.get('dir', 'temp/frame_cache')
+        self.format = config.get('format', 'parquet')
+        self.max_bytes = int(config.get('max_mb', 500)) * 1024 * 1024
+        self.enabled = config.get('enabled', False)
+        
+        if self.enabled and not HAS_PYARROW:
+            self.logger.warning("pyarrow não instalado, cache de DataFrames desativado")
+            self.enabled = False
+        
+        if self.format not in ('parquet', 'feather'):
+            raise ValueError(f"Formato de cache não suportado: {self.format}")
+        
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def file_digest(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """
+        Hash SHA-256 do conteúdo do arquivo
+        
+        Args:
+            file_path: Caminho do arquivo
+            chunk_size: Tamanho dos blocos lidos
+        
+        Returns:
+            Hash hexadecimal
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def key(self, file_path: str, settings: Dict[str, Any]) -> str:
+        """
+        Chave do cache: conteúdo do arquivo + configurações que afetam o resultado
+        
+        Args:
+            file_path: Caminho do arquivo de origem
+            settings: Configurações do leitor
+        
+        Returns:
+            Chave hexadecimal
+        """
+        settings_raw = json.dumps(settings, sort_keys=True, default=str)
+        combined = f"{self.file_digest(file_path)}:{settings_raw}"
+        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """Caminho do arquivo de uma entrada"""
+        return os.path.join(self.cache_dir, f"{key}.{self.format}")
+    
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Carrega uma entrada (com memory map)
+        
+        Args:
+            key: Chave gerada por `key`
+        
+        Returns:
+            DataFrame ou None se ausente
+        """
+        if not self.enabled:
+            return None
+        
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            if self.format == 'parquet':
+                import pyarrow.parquet as pq
+                table = pq.read_table(path, memory_map=True)
+            else:
+                import pyarrow.feather as feather
+                table = feather.read_table(path, memory_map=True)
+        except Exception as e:
+            self.logger.warning(f"Entrada de cache inválida descartada ({path}): {e}")
+            os.remove(path)
+            return None
+        
+        # Marca como usada recentemente (LRU)
+        os.utime(path)
+        return table.to_pandas()
+    
+    def put(self, key: str, df: pd.DataFrame):
+        """
+        Grava uma entrada e aplica o limite de tamanho
+        
+        Args:
+            key: Chave gerada por `key`
+            df: DataFrame a armazenar
+        """
+        if not self.enabled:
+            return
+        
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            if self.format == 'parquet':
+                df.to_parquet(tmp_path, index=False)
+            else:
+                df.reset_index(drop=True).to_feather(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # Tipos não serializáveis (ex.: colunas object mistas) não impedem o pipeline
+            self.logger.warning(f"Não foi possível armazenar DataFrame no cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        
+        self._evict()
+    
+    def _evict(self):
+        """Remove as entradas menos usadas até respeitar o limite de tamanho"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(f".{self.format}"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.logger.debug(f"Cache de DataFrames: removido {os.path.basename(path)} (LRU)")
@@ -0,0 +1,99 @@
+"""
+Índice limitado de chaves para deduplicação em blocos
+"""
+import logging
+from typing import List
+import numpy as np
+import pandas as pd
+
+
+class KeyIndex:
+    """Guarda os hashes (uint64) das chaves já vistas, com limite de tamanho"""
+    
+    def __init__(self, max_keys: int, logger: logging.Logger):
+        """
+        Inicializa o índice
+        
+        Args:
+            max_keys: Número máximo de chaves guardadas (8 bytes cada)
+            logger: Logger configurado
+        """
+        self.max_keys = max_keys
+        self.logger = logger
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._full = False
+    
+    @staticmethod
+    def hash_rows(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        Hash vetorizado das colunas da chave
+        
+        Valores iguais com tipos diferentes entre blocos/execuções geram o
+        mesmo hash (ex.: antes e depois de `compact_dtypes`): inteiros de
+        qualquer largura e floats inteiros (lidos como float por causa de
+        nulos) são hasheados como Int64, os demais floats como float64,
+        categorias como object e datas em nanossegundos.
+        
+        Args:
+            df: DataFrame
+            columns: Colunas da chave
+        
+        Returns:
+            Array uint64, um hash por linha
+        """
+        keys = df[columns]
+        for col in columns:
+            series = keys[col]
+            if pd.api.types.is_float_dtype(series.dtype):
+                integral = (series.dropna() % 1 == 0).all()
+                keys = keys.assign(**{col: series.astype('Int64' if integral else 'float64')})
+            elif pd.api.types.is_integer_dtype(series.dtype):
+                keys = keys.assign(**{col: series.astype('Int64')})
+            elif isinstance(series.dtype, pd.CategoricalDtype):
+                keys = keys.assign(**{col: series.astype(object)})
+            elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+                keys = keys.assign(**{col: series.dt.as_unit('ns')})
+        return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def filter_new(self, hashes: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """
+        Marca as linhas cuja chave ainda não foi vista e registra essas chaves
+        
+        Linhas com chave inválida (nula) são sempre mantidas. Depois de
+        atingido o limite, novas chaves deixam de ser registradas e a
+        deduplicação passa a valer só contra as chaves já guardadas.
+        
+        Args:
+            hashes: Hash da chave de cada linha
+            valid: Se a chave da linha é válida
+        
+        Returns:
+            Máscara das linhas a manter
+        """
+        keep = np.ones(len(hashes), dtype=bool)
+        if not len(hashes):
+            return keep
+        
+        # Duplicatas dentro do próprio bloco: vale a primeira ocorrência
+        first = ~pd.Series(hashes).duplicated(keep='first').to_numpy()
+        seen = np.isin(hashes, self._keys, assume_unique=False)
+        keep = ~valid | (first & ~seen)
+        
+        new_keys = np.unique(hashes[valid & keep])
+        if self._full or not len(new_keys):
+            return keep
+        
+        room = self.max_keys - len(self._keys)
+        if len(new_keys) > room:
+            self.logger.warning(
+                f"Índice de deduplicação atingiu {self.max_keys} chaves; "
+                "chaves novas não serão mais registradas"
+            )
+            new_keys = new_keys[:room]
+            self._full = True
+        
+        self._keys = np.union1d(self._keys, new_keys)
+        return keep
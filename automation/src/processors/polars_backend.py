@@ -0,0 +1,439 @@
+"""
+Backend Polars - mesmas etapas do DataProcessor em execução lazy e multithread
+"""
+import re
+import logging
+import importlib.util
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+HAS_POLARS = importlib.util.find_spec('polars') is not None
+
+if HAS_POLARS:
+    import polars as pl
+
+# Formatos de data convertidos em Polars: só diretivas numéricas de tamanho fixo
+SIMPLE_DATE_FORMAT = re.compile(r'^[^%]*(?:%[dmYHMS][^%]*)+$')
+
+# Diretiva numérica: aceita tudo o que o strptime do pandas aceita (e mais)
+DIRECTIVE = re.compile(r'(%[dmYHMS])')
+
+# Abaixo disso a conversão fica no pandas (ex.: amostra da inferência de formato)
+MIN_STRPTIME_VALUES = 1000
+
+
+class PolarsBackend:
+    """
+    Executa preparação das fontes e unificação em Polars
+    
+    Entrada e saída são DataFrames pandas, idênticos aos do caminho pandas
+    (referência). Tipos que não têm equivalente exato levantam
+    NotImplementedError, e o DataProcessor refaz a etapa em pandas.
+    """
+    
+    def __init__(self, config: dict, logger: logging.Logger, reference):
+        """
+        Inicializa o backend
+        
+        Args:
+            config: Configuração de processamento
+            logger: Logger configurado
+            reference: DataProcessor pandas (regras de colunas de data e conversão de datas)
+        """
+        self.config = config
+        self.logger = logger
+        self.reference = reference
+    
+    def _to_polars(self, df: pd.DataFrame) -> 'pl.DataFrame':
+        """
+        Converte para Polars, rejeitando tipos sem equivalente exato
+        
+        Categóricas viram Enum com as mesmas categorias, na mesma ordem.
+        
+        Args:
+            df: DataFrame pandas
+        
+        Returns:
+            DataFrame Polars
+        """
+        if not df.columns.is_unique:
+            raise NotImplementedError("colunas com nome repetido")
+        
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                supported = dtype.categories.dtype == object
+            else:
+                supported = isinstance(dtype, pd.DatetimeTZDtype) or (
+                    isinstance(dtype, np.dtype) and dtype.kind in 'biufMO'
+                )
+            if not supported:
+                raise NotImplementedError(f"tipo {dtype} em '{col}'")
+        
+        try:
+            frame = pl.from_pandas(df)
+        except Exception as e:
+            raise NotImplementedError(f"conversão para Polars: {e}") from e
+        
+        casts = {}
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                casts[col] = pl.col(col).cast(pl.String).cast(pl.Enum(dtype.categories.tolist()))
+            elif dtype == object and frame.schema[col] != pl.String:
+                # Colunas object com números, listas ou dicts (ex.: vindos da API)
+                raise NotImplementedError(f"valores não textuais em '{col}'")
+        return frame.with_columns(**casts) if casts else frame
+    
+    @staticmethod
+    def _to_pandas(frame: 'pl.DataFrame') -> pd.DataFrame:
+        """
+        Converte de volta para pandas (Enum vira categórica não ordenada, como no pandas)
+        
+        Args:
+            frame: DataFrame Polars
+        
+        Returns:
+            DataFrame pandas
+        """
+        result = frame.to_pandas()
+        for col, dtype in frame.schema.items():
+            if isinstance(dtype, pl.Enum):
+                result[col] = result[col].cat.as_unordered()
+        return result
+    
+    def prepare_source(self, df: pd.DataFrame, source: str) -> pd.DataFrame:
+        """
+        Equivalente de DataProcessor.prepare_source (colunas, datas e status)
+        
+        Datas e status são resolvidos uma vez por valor distinto (datas pela
+        implementação pandas de referência) e aplicados às linhas em Polars.
+        
+        Args:
+            df: DataFrame da fonte
+            source: 'fonte1' ou 'fonte2'
+        
+        Returns:
+            DataFrame normalizado
+        """
+        if df.columns.empty:
+            # Fonte desativada/sem dados: nada a converter
+            return self.reference.normalize_columns(df, source)
+        
+        frame = self._to_polars(df)
+        
+        # 1. Mapeamento de colunas
+        mapping = self.config.get('column_mapping', {}).get(source, {})
+        if not mapping:
+            self.logger.warning(f"Nenhum mapeamento de colunas definido para {source}")
+        renamed = {old: new for old, new in mapping.items() if old in frame.columns}
+        if len((set(frame.columns) - set(renamed)) | set(renamed.values())) < frame.width:
+            raise NotImplementedError("mapeamento gera colunas com nome repetido")
+        if renamed:
+            self.logger.info(f"Colunas normalizadas: {', '.join(f'{old} → {new}' for old, new in renamed.items())}")
+        frame = frame.rename(renamed)
+        
+        lazy = frame.lazy()
+        
+        # 2. Datas
+        for col in self.reference._date_columns(frame.columns):
+            try:
+                lazy = lazy.with_columns(self._date_expr(frame.get_column(col), col, source))
+                self.logger.info(f"✓ Coluna '{col}' normalizada para datetime com timezone {self.reference.timezone}")
+            except NotImplementedError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Erro ao normalizar data na coluna '{col}': {e}")
+        
+        # 3. Status
+        if 'status' in frame.columns:
+            expr = self._status_expr(frame.get_column('status'))
+            if expr is not None:
+                lazy = lazy.with_columns(expr)
+        
+        result = self._to_pandas(lazy.collect())
+        result.index = df.index
+        return result
+    
+    def _date_expr(self, values: 'pl.Series', col: str, source: str) -> 'pl.Expr':
+        """
+        Expressão que substitui cada valor pela data convertida
+        
+        Args:
+            values: Coluna original
+            col: Nome da coluna
+            source: Fonte de origem (chave do formato inferido)
+        
+        Returns:
+            Expressão Polars
+        """
+        if values.dtype not in (pl.String, pl.Datetime) and not values.dtype.is_numeric():
+            raise NotImplementedError(f"tipo {values.dtype} na coluna de data '{col}'")
+        
+        # Mesma ordem de primeira ocorrência do pd.factorize usado na referência
+        uniques = values.unique(maintain_order=True).drop_nulls()
+        parsed = self.reference._parse_dates(uniques.to_pandas(), col, source)
+        dtype = pl.Datetime('ns', str(self.reference.timezone))
+        return pl.col(col).replace_strict(uniques, pl.from_pandas(parsed), default=None, return_dtype=dtype)
+    
+    @staticmethod
+    def _format_pattern(fmt: str) -> str:
+        """
+        Regex que casa qualquer texto que o pandas consiga converter com `fmt`
+        
+        Args:
+            fmt: Formato strptime com diretivas numéricas
+        
+        Returns:
+            Expressão regular
+        """
+        parts = []
+        for token in DIRECTIVE.split(fmt):
+            if DIRECTIVE.fullmatch(token):
+                parts.append(r'\s?\d{1,4}')
+            else:
+                parts.extend(r'\s+' if chunk.isspace() else re.escape(chunk) for chunk in re.split(r'(\s+)', token) if chunk)
+        return r'(?i)^\s*' + ''.join(parts) + r'\s*$'
+    
+    def strptime(self, values: pd.Index, fmt: Optional[str]) -> Optional[pd.DatetimeIndex]:
+        """
+        Converte textos para datetime sem timezone em Polars (multithread)
+        
+        Só aceita o resultado do Polars quando o valor formatado de volta é
+        idêntico ao texto original. Os demais (sem zero à esquerda, espaços,
+        datas inválidas) são convertidos pelo pandas, garantindo o mesmo
+        resultado; textos fora do padrão do formato viram NaT diretamente.
+        
+        Args:
+            values: Valores distintos
+            fmt: Formato strptime
+        
+        Returns:
+            DatetimeIndex sem timezone ou None se o formato/valores não forem suportados
+        """
+        if len(values) < MIN_STRPTIME_VALUES or not fmt or not SIMPLE_DATE_FORMAT.match(fmt):
+            return None
+        
+        try:
+            texts = pl.Series(values.tolist(), dtype=pl.String, strict=True)
+        except (TypeError, pl.exceptions.PolarsError):
+            return None
+        
+        parsed = texts.str.strptime(pl.Datetime('ns'), fmt, strict=False, exact=True)
+        exact = (parsed.dt.strftime(fmt) == texts).fill_null(False).to_numpy()
+        candidate = texts.str.contains(self._format_pattern(fmt)).fill_null(False).to_numpy()
+        
+        result = parsed.to_numpy().astype('datetime64[ns]')
+        result[~exact] = np.datetime64('NaT')
+        rest = candidate & ~exact
+        if rest.any():
+            result[rest] = pd.to_datetime(values[rest], format=fmt, errors='coerce').to_numpy(dtype='datetime64[ns]')
+        return pd.DatetimeIndex(result)
+    
+    def _status_expr(self, values: 'pl.Series', column: str = 'status') -> Optional['pl.Expr']:
+        """
+        Expressão equivalente a DataProcessor.translate_status
+        
+        Args:
+            values: Coluna de status
+            column: Nome da coluna
+        
+        Returns:
+            Expressão Polars ou None se não houver tradução configurada
+        """
+        translation = self.config.get('status_translation', {})
+        if not translation:
+            return None
+        if values.dtype not in (pl.String, pl.Enum):
+            raise NotImplementedError(f"tipo {values.dtype} na coluna '{column}'")
+        
+        lookup = {str(code).upper(): label for code, label in translation.items()}
+        labels = list(dict.fromkeys(translation.values()))
+        
+        values = values.cast(pl.String)
+        uniques = values.unique(maintain_order=True).drop_nulls()
+        translated = [lookup.get(code.upper(), code) for code in uniques.to_list()]
+        unmapped = [code for code in uniques.to_list() if code.upper() not in lookup and code not in labels]
+        
+        categories = labels + [code for code in translated if code not in labels]
+        expr = pl.col(column).cast(pl.String).replace_strict(
+            uniques, pl.Series(translated, dtype=pl.String), default=None, return_dtype=pl.Enum(categories)
+        )
+        
+        if unmapped:
+            counts = dict(values.filter(values.is_in(unmapped)).value_counts().iter_rows())
+            summary = ', '.join(f"{code} ({counts[code]})" for code in unmapped)
+            self.logger.warning(f"Status sem tradução na coluna '{column}': {summary}")
+        
+        self.logger.info(f"✓ Status traduzidos na coluna '{column}'")
+        return expr
+    
+    def _merge_frames(self, df1: pd.DataFrame, df2: pd.DataFrame) -> Tuple['pl.LazyFrame', List[str]]:
+        """
+        Concatena as fontes com as mesmas regras de tipo de DataProcessor.merge_datasets
+        
+        Args:
+            df1: DataFrame da Fonte 1
+            df2: DataFrame da Fonte 2
+        
+        Returns:
+            LazyFrame concatenado e ordem final das colunas
+        """
+        columns = list(df1.columns) + [col for col in df2.columns if col not in df1.columns]
+        columns = [col for col in columns if col != 'fonte'] + ['fonte']
+        
+        sources = [
+            self._to_polars(df).with_columns(fonte=pl.lit(label))
+            for df, label in ((df1, 'Fonte 1'), (df2, 'Fonte 2'))
+        ]
+        
+        # Fontes vazias não entram no concat; suas colunas exclusivas ficam float nulas (como no reindex)
+        present = [frame for frame in sources if frame.height]
+        if not present:
+            raise NotImplementedError("ambas as fontes vazias")
+        known = set().union(*(frame.columns for frame in present))
+        
+        schemas: Dict[str, list] = {}
+        for frame in present:
+            for col, dtype in frame.schema.items():
+                schemas.setdefault(col, []).append(dtype)
+        
+        # Categorias unificadas na ordem Fonte 1 → Fonte 2 (fontes vazias também contribuem)
+        casts = {}
+        for col in columns:
+            dtypes = schemas.get(col, [])
+            if any(col in frame.columns and isinstance(frame.schema[col], pl.Enum) for frame in sources):
+                categories: Dict[str, None] = {}
+                for frame in sources:
+                    if col not in frame.columns:
+                        continue
+                    series = frame.get_column(col)
+                    if isinstance(series.dtype, pl.Enum):
+                        values = series.dtype.categories.to_list()
+                    elif series.dtype == pl.String:
+                        values = series.drop_nulls().unique(maintain_order=True).to_list()
+                    else:
+                        raise NotImplementedError(f"categórica e {series.dtype} na coluna '{col}'")
+                    categories.update(dict.fromkeys(values))
+                casts[col] = pl.Enum(list(categories))
+            elif len(set(dtypes)) > 1 and not set(dtypes) <= {pl.Int64, pl.Float64}:
+                raise NotImplementedError(f"tipos {', '.join(map(str, set(dtypes)))} na coluna '{col}'")
+        
+        lazies = [
+            frame.lazy().with_columns(
+                *(pl.col(col).cast(dtype) for col, dtype in casts.items() if col in frame.columns)
+            )
+            for frame in present
+        ]
+        merged = pl.concat(lazies, how='diagonal_relaxed').with_columns(
+            *(pl.lit(None, dtype=casts.get(col, pl.Float64)).alias(col) for col in columns if col not in known)
+        )
+        return merged.select(columns), columns
+    
+    def _dedup_mask(self, lazy: 'pl.LazyFrame', columns: List[str]) -> Tuple[Optional['pl.LazyFrame'], List[str]]:
+        """
+        Marca as linhas mantidas, como DataProcessor.drop_duplicate_records
+        
+        Args:
+            lazy: LazyFrame unificado com coluna '__linha'
+            columns: Colunas do DataFrame
+        
+        Returns:
+            LazyFrame com a coluna '__manter' (None se não houver chave) e a chave usada
+        """
+        config = self.config.get('deduplication', {})
+        key = [col for col in config.get('key', []) if col in columns]
+        
+        if len(key) < len(config.get('key', [])):
+            self.logger.warning(f"Chave de deduplicação incompleta no DataFrame: {config.get('key')}, usando linha inteira")
+            key = []
+        business_key = bool(key)
+        if not key:
+            key = [col for col in columns if col != 'fonte']
+        if not key:
+            return None, key
+        
+        keep = config.get('keep', 'fonte1')
+        order_by = config.get('order_by')
+        if keep == 'latest':
+            if order_by in columns:
+                dtype = lazy.collect_schema()[order_by]
+                if not isinstance(dtype, pl.Datetime):
+                    raise NotImplementedError(f"coluna '{order_by}' de deduplicação não é datetime")
+                lazy = lazy.sort(order_by, descending=True, nulls_last=True, maintain_order=True)
+            else:
+                self.logger.warning(f"Coluna '{order_by}' de deduplicação ausente, mantendo a primeira ocorrência")
+        elif keep == 'fonte2':
+            lazy = lazy.sort(pl.col('fonte') != 'Fonte 2', maintain_order=True)
+        
+        # Com chave de negócio, linhas com chave nula nunca são removidas
+        keep_rows = pl.struct(key).is_first_distinct()
+        if business_key:
+            keep_rows = keep_rows | ~pl.all_horizontal([pl.col(col).is_not_null() for col in key])
+        lazy = lazy.with_columns(__manter=keep_rows)
+        return lazy.sort('__linha'), key
+    
+    def merge_and_fill(self, df1: pd.DataFrame, df2: pd.DataFrame) -> pd.DataFrame:
+        """
+        Equivalente de merge_datasets seguido de handle_missing_values
+        
+        Args:
+            df1: Fonte 1 após prepare_source
+            df2: Fonte 2 após prepare_source
+        
+        Returns:
+            DataFrame unificado com nulos tratados
+        """
+        self.logger.info(f"Unificando datasets: Fonte1({len(df1)} linhas) + Fonte2({len(df2)} linhas)")
+        
+        lazy, columns = self._merge_frames(df1, df2)
+        lazy = lazy.with_row_index('__linha')
+        
+        marked, key = self._dedup_mask(lazy, columns)
+        dropped = 0
+        if marked is None:
+            frame = lazy.collect()
+        else:
+            frame = marked.collect()
+            dropped = frame.height - int(frame.get_column('__manter').sum())
+            if dropped:
+                self.logger.info(f"Duplicatas removidas por {', '.join(key[:5])}{'...' if len(key) > 5 else ''}: {dropped}")
+                frame = frame.filter(pl.col('__manter'))
+            frame = frame.drop('__manter')
+        
+        self.logger.info(f"✓ Datasets unificados: {frame.height} linhas totais")
+        
+        # Nulos: texto → '', categóricas ganham a categoria '', numéricas → 0
+        null_counts = frame.drop('__linha').null_count().row(0, named=True)
+        null_counts = pd.Series(null_counts, dtype='int64')
+        if null_counts.sum() > 0:
+            self.logger.info(f"Valores nulos encontrados:\n{null_counts[null_counts > 0]}")
+        
+        fills = []
+        for col, dtype in frame.drop('__linha').schema.items():
+            if dtype == pl.String:
+                fills.append(pl.col(col).fill_null(''))
+            elif not null_counts[col]:
+                continue
+            elif isinstance(dtype, pl.Enum):
+                categories = dtype.categories.to_list()
+                if '' not in categories:
+                    categories.append('')
+                fills.append(pl.col(col).cast(pl.Enum(categories)).fill_null(''))
+            elif dtype == pl.Boolean:
+                raise NotImplementedError(f"booleana com nulos na coluna '{col}'")
+            elif dtype.is_integer():
+                # pandas representa inteiros com nulos como float64
+                fills.append(pl.col(col).cast(pl.Float64).fill_null(0))
+            elif dtype.is_float():
+                fills.append(pl.col(col).fill_null(0))
+        
+        frame = frame.lazy().with_columns(fills).collect() if fills else frame
+        rows = frame.get_column('__linha').to_numpy()
+        result = self._to_pandas(frame.drop('__linha'))
+        if dropped:
+            # Mesmo índice do filtro booleano do pandas: posições no concat
+            result.index = pd.Index(rows.astype('int64'))
+        
+        self.logger.info("✓ Valores nulos tratados")
+        return result
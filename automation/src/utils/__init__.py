@@ -1,4 +1,5 @@
 """Inicializador do pacote utils"""
 from .logger import setup_logger
+from .driver_provider import DriverProvider
 
-__all__ = ['setup_logger']
+__all__ = ['setup_logger', 'DriverProvider']
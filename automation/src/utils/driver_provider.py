@@ -0,0 +1,156 @@
+"""
+Provisionamento compartilhado do ChromeDriver (scraper e screenshot)
+"""
+import os
+import json
+import shutil
+import logging
+import threading
+import subprocess
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+
+class DriverProvider:
+    """Resolve o chromedriver uma única vez, com cache em disco, e reaproveita as Options"""
+    
+    # Caminho resolvido compartilhado por todas as instâncias do processo
+    _resolved: Dict[str, str] = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, config: dict, logger: logging.Logger):
+        """
+        Inicializa o provedor
+        
+        Args:
+            config: Configuração `browser`
+            logger: Logger configurado
+        """
+        self.config = config
+        self.logger = logger
+        self.cache_file = config.get('driver_cache_file', 'temp/chromedriver.json')
+        self.pinned_path = config.get('driver_path')
+        self.offline = config.get('offline', False)
+        self._options: Dict[str, Options] = {}
+    
+    def _read_cache(self) -> dict:
+        """Lê o cache em disco (vazio se ausente ou inválido)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_cache(self, path: str, version: Optional[str]):
+        """Grava o caminho e a versão resolvidos"""
+        directory = os.path.dirname(self.cache_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'path': path,
+                'version': version,
+                'resolved_at': datetime.now().isoformat(timespec='seconds')
+            }, f)
+    
+    @staticmethod
+    def _driver_version(path: str) -> Optional[str]:
+        """Versão informada por `chromedriver --version`"""
+        try:
+            output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        parts = output.split()
+        return parts[1] if len(parts) > 1 else None
+    
+    def resolve_driver_path(self, force: bool = False) -> str:
+        """
+        Obtém o caminho do chromedriver
+        
+        Ordem: caminho fixado em config, cache do processo, cache em disco,
+        chromedriver no PATH (modo offline) e, por fim, webdriver-manager.
+        
+        Args:
+            force: Ignorar caches e resolver novamente
+        
+        Returns:
+            Caminho do executável
+        """
+        with self._lock:
+            if self.pinned_path:
+                return self.pinned_path
+            
+            if not force:
+                cached = self._resolved.get('path')
+                if cached and os.path.exists(cached):
+                    return cached
+                
+                cached = self._read_cache()
+                if cached.get('path') and os.path.exists(cached['path']):
+                    self.logger.info(f"ChromeDriver em cache: {cached['path']} (versão {cached.get('version')})")
+                    self._resolved['path'] = cached['path']
+                    return cached['path']
+            
+            if self.offline:
+                path = shutil.which('chromedriver')
+                if not path:
+                    raise RuntimeError("Modo offline: nenhum chromedriver em cache ou no PATH")
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+                path = ChromeDriverManager().install()
+            
+            version = self._driver_version(path)
+            self._write_cache(path, version)
+            self._resolved['path'] = path
+            self.logger.info(f"ChromeDriver resolvido: {path} (versão {version})")
+            return path
+    
+    def invalidate(self):
+        """Descarta o caminho em cache (ex.: versão incompatível com o Chrome)"""
+        with self._lock:
+            self._resolved.pop('path', None)
+            if os.path.exists(self.cache_file):
+                os.remove(self.cache_file)
+    
+    def get_options(self, key: str, builder: Callable[[Options], None]) -> Options:
+        """
+        Retorna as Options de um perfil, construídas apenas na primeira chamada
+        
+        Args:
+            key: Identificador do perfil (ex.: 'scraper', 'screenshot')
+            builder: Função que preenche as Options do perfil
+        
+        Returns:
+            Options do Chrome
+        """
+        if key not in self._options:
+            options = Options()
+            builder(options)
+            self._options[key] = options
+        return self._options[key]
+    
+    def create_driver(self, options: Options) -> webdriver.Chrome:
+        """
+        Inicia o Chrome com o driver resolvido
+        
+        Se o driver em cache não for compatível com o Chrome instalado,
+        resolve novamente (fora do modo offline) e tenta mais uma vez.
+        
+        Args:
+            options: Options do Chrome
+        
+        Returns:
+            Driver Selenium
+        """
+        try:
+            return webdriver.Chrome(service=Service(self.resolve_driver_path()), options=options)
+        except SessionNotCreatedException:
+            if self.offline or self.pinned_path:
+                raise
+            self.logger.warning("ChromeDriver em cache incompatível, resolvendo novamente")
+            self.invalidate()
+            return webdriver.Chrome(service=Service(self.resolve_driver_path(force=True)), options=options)